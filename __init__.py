@@ -1,6 +1,9 @@
 import bpy
+from bpy.app.handlers import persistent
 
 from .operators import *
+from .operators.utils import clear_glyph_cache
+from .operators.utils import update_live_objects
 
 bl_info = {
     "name": "Grease Writer",
@@ -39,7 +42,10 @@ class GREASEPENCIL_PT_greasewriter(bpy.types.Panel):
 
         layout.separator()
 
-        layout.operator("grease_writer.reanimate", icon="HAND")
+        row = layout.row()
+        row.operator("grease_writer.reanimate", icon="HAND")
+        row.prop(gpencil, "reanimate_layers", text="")
+        layout.operator("grease_writer.bake_live")
 
         layout.separator()
 
@@ -54,6 +60,7 @@ class GREASEPENCIL_PT_greasewriter(bpy.types.Panel):
         row = layout.row()
         row.operator("grease_writer.trace", icon="PIVOT_CURSOR")
         row.prop(gpencil, 'trace2d')
+        row.prop(gpencil, 'trace_analytic')
 
 
 class SCENE_PT_greasewriter(bpy.types.Panel):
@@ -73,12 +80,26 @@ class SCENE_PT_greasewriter(bpy.types.Panel):
         layout.prop(scene, 'gw_word_space')
         layout.prop(scene, 'gw_line_height')
         layout.prop(scene, 'gw_thickness')
+        layout.prop(scene, 'gw_simplify')
         layout.prop(scene, 'gw_color')
         layout.prop(scene, 'gw_font')
+        layout.prop(scene, 'gw_build_mode')
+        layout.prop(scene, 'gw_incremental')
         row = layout.row()
         row.prop_search(scene, 'gw_source_text_file', bpy.data, "texts", text="")
         row.prop(scene, 'gw_source_text', text="")
         layout.operator("grease_writer.write", icon="FILE_TEXT")
+        layout.operator("grease_writer.write_batch", icon="FILE_FOLDER")
+        layout.operator("grease_writer.purge_materials", icon="TRASH")
+
+
+def update_font(self, context):
+    clear_glyph_cache(self.gw_font)
+
+
+@persistent
+def live_frame_change(scene, *args):
+    update_live_objects(scene)
 
 
 def init_props():
@@ -124,6 +145,13 @@ def init_props():
         min=1
     )
 
+    bpy.types.Scene.gw_simplify = bpy.props.FloatProperty(
+        name="Simplify",
+        description="Drop glyph vertices that would move the strokes by less than this many pixels in the render, as seen by the scene camera or across 8 units without one; 0 keeps every vertex",
+        default=0.0,
+        min=0.0
+    )
+
     bpy.types.Scene.gw_color = bpy.props.FloatVectorProperty(
        subtype='COLOR_GAMMA',
        name="Color",
@@ -147,6 +175,27 @@ def init_props():
         items=fonts,
         description="The font to be used for writing",
         default="consolas",
+        update=update_font
+    )
+
+    build_modes = [
+        ("FULL", "Full Frames", "Every frame holds all of the strokes drawn so far"),
+        ("LINEAR", "Linear", "Keep finished strokes on separate layers so frames only hold the stroke being drawn"),
+        ("LIVE", "Live", "Only store the finished strokes and draw the animation as the frame changes; bake it to render without the add-on"),
+        ("INSTANCED", "Instanced", "Write the finished text without animation, drawing each distinct character once and linking every occurrence to it")
+    ]
+
+    bpy.types.Scene.gw_build_mode = bpy.props.EnumProperty(
+        name="Build Mode",
+        items=build_modes,
+        description="How the animation frames are built",
+        default="FULL",
+    )
+
+    bpy.types.Scene.gw_incremental = bpy.props.BoolProperty(
+        name="Incremental",
+        description="Rewrite the active written object, only regenerating the lines that changed",
+        default=False
     )
 
     bpy.types.Scene.gw_source_text_file = bpy.props.StringProperty(
@@ -177,6 +226,19 @@ def init_props():
         default="underline",
     )
 
+    reanimate_rules = [
+        ("FIRST", "First Layer", "Only reanimate the first layer, replacing all of its keyframes"),
+        ("SEQUENCE", "Layer by Layer", "Reanimate every layer, drawing each one completely before the next"),
+        ("INTERLEAVE", "Interleave", "Reanimate every layer, drawing one stroke of each layer in turn")
+    ]
+
+    bpy.types.GreasePencil.reanimate_layers = bpy.props.EnumProperty(
+        name="Layers",
+        items=reanimate_rules,
+        description="Which layers to reanimate and in what order",
+        default="FIRST",
+    )
+
     bpy.types.GreasePencil.tracer_obj = bpy.props.StringProperty()
 
     bpy.types.GreasePencil.trace2d = bpy.props.BoolProperty(
@@ -185,6 +247,12 @@ def init_props():
         default=True
     )
 
+    bpy.types.GreasePencil.trace_analytic = bpy.props.BoolProperty(
+        name="From Strokes",
+        description="Compute the path from the strokes and draw speed instead of reading every baked frame",
+        default=False
+    )
+
     bpy.types.GreasePencil.stipple_length = bpy.props.FloatProperty(
        name="Length",
        description="The length of the stipples",
@@ -204,9 +272,12 @@ classes = [
     SCENE_PT_greasewriter,
     GREASEPENCIL_OT_reanimate,
     GREASEPENCIL_OT_write,
+    GREASEPENCIL_OT_write_batch,
     GREASEPENCIL_OT_trace,
     GREASEPENCIL_OT_decorate,
-    GREASEPENCIL_OT_stippleit
+    GREASEPENCIL_OT_stippleit,
+    GREASEPENCIL_OT_purge_materials,
+    GREASEPENCIL_OT_bake_live
 ]
 
 def register():
@@ -216,7 +287,12 @@ def register():
     for cls in classes:
         register_class(cls)
 
+    bpy.app.handlers.frame_change_pre.append(live_frame_change)
+
 def unregister():
+    if live_frame_change in bpy.app.handlers.frame_change_pre:
+        bpy.app.handlers.frame_change_pre.remove(live_frame_change)
+
     from bpy.utils import unregister_class
     for cls in reversed(classes):
         unregister_class(cls)
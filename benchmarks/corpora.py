@@ -0,0 +1,54 @@
+"""
+Standard texts for the benchmarks: one word, a paragraph, and about ten
+thousand characters, in Latin and Cyrillic script.
+"""
+
+LATIN_WORD = "Handwriting"
+
+LATIN_PARAGRAPH = (
+    "The quick brown fox jumps over the lazy dog, then\n"
+    "circles back to see if anyone noticed. Nobody did,\n"
+    "so it wrote the whole story down by hand: 42 pages,\n"
+    "each one signed and dated (with a flourish!)."
+)
+
+CYRILLIC_WORD = "Почерк"
+
+CYRILLIC_PARAGRAPH = (
+    "Съешь же ещё этих мягких французских булок, да\n"
+    "выпей чаю. Широкая электрификация южных губерний\n"
+    "даст мощный толчок подъёму сельского хозяйства.\n"
+    "В чащах юга жил бы цитрус? Да, но фальшивый экземпляр!"
+)
+
+# The bundled fonts that only cover Cyrillic letters
+CYRILLIC_FONTS = ["shohrukh_russian", "shohrukh_tajik"]
+
+
+def repeat_to_length(paragraph, length):
+    """
+    Repeat a paragraph, one copy after another, until the text holds at
+    least length characters
+    """
+    copies = []
+    total = 0
+    while total < length:
+        copies.append(paragraph)
+        total += len(paragraph) + 1
+    return "\n".join(copies)
+
+
+def get_corpora(font):
+    """
+    Get the corpora for a font as a dict of name: text
+    """
+    if font in CYRILLIC_FONTS:
+        word, paragraph = CYRILLIC_WORD, CYRILLIC_PARAGRAPH
+    else:
+        word, paragraph = LATIN_WORD, LATIN_PARAGRAPH
+
+    return {
+        "word": word,
+        "paragraph": paragraph,
+        "10k": repeat_to_length(paragraph, 10000),
+    }
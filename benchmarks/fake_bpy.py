@@ -0,0 +1,271 @@
+"""
+A lightweight stand-in for the parts of bpy that Grease Writer touches,
+so the pipeline can be timed without Blender.
+
+Stroke points are kept in one numpy array per stroke, so points.add,
+foreach_set and foreach_get cost about what they do in Blender instead of
+dominating the measurements.
+"""
+import sys
+import types
+import bisect
+import numpy as np
+
+
+class Vector(object):
+    def __init__(self, array, row):
+        self._array = array
+        self._row = row
+
+    def __getitem__(self, index):
+        return float(self._array[self._row, index])
+
+    def __setitem__(self, index, value):
+        self._array[self._row, index] = value
+
+    x = property(lambda self: self[0], lambda self, value: self.__setitem__(0, value))
+    y = property(lambda self: self[1], lambda self, value: self.__setitem__(1, value))
+    z = property(lambda self: self[2], lambda self, value: self.__setitem__(2, value))
+
+
+class GPencilStrokePoint(object):
+    def __init__(self, points, row):
+        self.co = Vector(points.co, row)
+
+
+class GPencilStrokePoints(object):
+    def __init__(self):
+        self.co = np.zeros((0, 3), dtype=np.float32)
+
+    def __len__(self):
+        return len(self.co)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.co)
+        if not 0 <= index < len(self.co):
+            raise IndexError(index)
+        return GPencilStrokePoint(self, index)
+
+    def __iter__(self):
+        for index in range(len(self.co)):
+            yield GPencilStrokePoint(self, index)
+
+    def add(self, count=1):
+        self.co = np.concatenate((self.co, np.zeros((count, 3), dtype=np.float32)))
+
+    def foreach_set(self, attr, seq):
+        values = np.asarray(seq, dtype=np.float32)
+        if attr != "co" or values.size != self.co.size:
+            raise TypeError("foreach_set: expected " + str(self.co.size) + " values for " + attr)
+        self.co[:] = values.reshape(-1, 3)
+
+    def foreach_get(self, attr, seq):
+        if attr != "co" or len(seq) != self.co.size:
+            raise TypeError("foreach_get: expected " + str(self.co.size) + " values for " + attr)
+        seq[:] = self.co.reshape(-1)
+
+
+class GPencilStroke(object):
+    def __init__(self):
+        self.points = GPencilStrokePoints()
+        self.line_width = 0
+        self.display_mode = 'SCREEN'
+        self.material_index = 0
+
+
+class GPencilStrokes(list):
+    def new(self):
+        stroke = GPencilStroke()
+        self.append(stroke)
+        return stroke
+
+    def foreach_get(self, attr, seq):
+        if len(seq) != len(self):
+            raise TypeError("foreach_get: expected " + str(len(self)) + " values for " + attr)
+        seq[:] = [getattr(stroke, attr) for stroke in self]
+
+
+class GPencilFrame(object):
+    def __init__(self, frame_number):
+        self.frame_number = frame_number
+        self.strokes = GPencilStrokes()
+
+
+class GPencilFrames(list):
+    def new(self, frame_number):
+        if len(self) > 0 and self[-1].frame_number < frame_number:
+            position = len(self)
+        else:
+            numbers = [frame.frame_number for frame in self]
+            if frame_number in numbers:
+                raise RuntimeError("Frame already exists on frame number " + str(frame_number))
+            position = bisect.bisect(numbers, frame_number)
+        frame = GPencilFrame(frame_number)
+        self.insert(position, frame)
+        return frame
+
+
+class GPencilLayer(object):
+    def __init__(self, info):
+        self.info = info
+        self.frames = GPencilFrames()
+
+    def clear(self):
+        del self.frames[:]
+
+
+class GreasePencilLayers(list):
+    def new(self, name, set_active=True):
+        layer = GPencilLayer(name)
+        self.append(layer)
+        return layer
+
+    def get(self, name, default=None):
+        for layer in self:
+            if layer.info == name:
+                return layer
+        return default
+
+
+class GreasePencil(dict):
+    def __init__(self, name='GPencil'):
+        dict.__init__(self)
+        self.name = name
+        self.layers = GreasePencilLayers()
+        self.materials = []
+        self.reanimate_layers = 'FIRST'
+        self.users = 0
+
+
+class Material(object):
+    def __init__(self, name):
+        self.name = name
+
+
+class Object(dict):
+    def __init__(self, name, data):
+        dict.__init__(self)
+        self.name = name
+        self.data = data
+        data.users += 1
+        self.location = [0.0, 0.0, 0.0]
+        self.scale = [1.0, 1.0, 1.0]
+        self._parent = None
+        self._children = []
+        self.users_collection = []
+
+    @property
+    def parent(self):
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent):
+        if self._parent is not None:
+            self._parent._children.remove(self)
+        self._parent = parent
+        if parent is not None:
+            parent._children.append(self)
+
+    @property
+    def children(self):
+        return tuple(self._children)
+
+
+class CollectionObjects(list):
+    def __init__(self, collection):
+        list.__init__(self)
+        self.collection = collection
+
+    def link(self, obj):
+        self.append(obj)
+        obj.users_collection.append(self.collection)
+
+
+class Collection(object):
+    def __init__(self, name):
+        self.name = name
+        self.objects = CollectionObjects(self)
+
+
+class Scene(object):
+    def __init__(self):
+        self.frame_current = 1
+        self.gw_scale = 1.0
+        self.gw_speed = 1.0
+        self.gw_kerning = 1.0
+        self.gw_word_space = 1.0
+        self.gw_line_height = 1.0
+        self.gw_thickness = 100
+        self.gw_simplify = 0.0
+        self.gw_color = (0, 0, 0)
+        self.gw_font = 'consolas'
+        self.gw_build_mode = 'FULL'
+        self.gw_incremental = False
+        self.collection = Collection('Scene Collection')
+
+
+def remove_item(items, item):
+    # The stand-ins are dicts, which compare equal by their custom
+    # properties, so find the item itself rather than an equal one
+    for i in range(len(items)):
+        if items[i] is item:
+            del items[i]
+            return
+    raise ValueError("Item not found")
+
+
+class BlendDataGreasePencils(list):
+    def new(self, name):
+        gpencil = GreasePencil(name)
+        self.append(gpencil)
+        return gpencil
+
+    def remove(self, gpencil):
+        remove_item(self, gpencil)
+
+
+class BlendDataObjects(list):
+    def new(self, name, data):
+        obj = Object(name, data)
+        self.append(obj)
+        return obj
+
+    def remove(self, obj):
+        obj.parent = None
+        obj.data.users -= 1
+        remove_item(self, obj)
+
+
+def property_stub(**options):
+    return None
+
+
+def install():
+    """
+    Put the stand-in into sys.modules as bpy, before any Grease Writer
+    module is imported
+    """
+    bpy = types.ModuleType('bpy')
+    bpy.types = types.SimpleNamespace(Operator=object, Panel=object)
+    bpy.props = types.SimpleNamespace(**{
+        name: property_stub
+        for name in ['BoolProperty', 'EnumProperty', 'FloatProperty', 'FloatVectorProperty',
+                     'IntProperty', 'StringProperty']
+    })
+    bpy.context = types.SimpleNamespace(scene=Scene())
+    bpy.data = types.SimpleNamespace(
+        grease_pencils=BlendDataGreasePencils(),
+        objects=BlendDataObjects(),
+    )
+    sys.modules['bpy'] = bpy
+    return bpy
+
+
+def new_object(name='greasewritten'):
+    """
+    Create a grease pencil object without going through bpy.data
+    """
+    obj = Object(name, GreasePencil(name))
+    obj.data.materials.append(Material('writings'))
+    return obj
@@ -0,0 +1,204 @@
+"""
+Time the Grease Writer pipeline without Blender and write the results as
+JSON, so that runs from different commits can be compared.
+
+Usage:
+    python benchmarks/run_benchmarks.py --output results.json
+    python benchmarks/run_benchmarks.py --output new.json --compare old.json
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+
+BENCHMARKS_FOLDER = os.path.dirname(os.path.abspath(__file__))
+ROOT_FOLDER = os.path.dirname(BENCHMARKS_FOLDER)
+sys.path.insert(0, BENCHMARKS_FOLDER)
+sys.path.insert(0, ROOT_FOLDER)
+
+import numpy as np
+import fake_bpy
+from corpora import get_corpora
+
+bpy = fake_bpy.install()
+
+from operators.utils import clear_glyph_cache, load_glyph, layout_text
+from operators.utils import iter_framed_strokes, draw_glyph, draw_live, draw_instanced
+from operators.utils.layout import font_props
+from operators.decorate import get_glyph_size, get_decorator_strokes
+
+DECORATOR_STYLES = [
+    "underline",
+    "over-underline",
+    "box",
+    "ellipse",
+    "circle",
+    "strike-through",
+    "x-out",
+    "helioid",
+]
+
+# Every frame of a full build repeats all earlier strokes, which makes long
+# texts take too long to be useful as a benchmark
+FULL_BUILD_LIMIT = 1000
+
+
+def best_time(function, repeat):
+    """
+    Run a function repeat times and get the fastest run in seconds
+    """
+    times = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def load_glyphs(font, text):
+    clear_glyph_cache()
+    for char in set(text):
+        if char not in " \n":
+            load_glyph(font, char)
+
+
+def resample(glyph_strokes, speed):
+    for framed_stroke in iter_framed_strokes(glyph_strokes, speed):
+        pass
+
+
+def emit(glyph_strokes, build_mode):
+    scene = bpy.context.scene
+    scene.gw_build_mode = build_mode
+    scene.frame_current = 1
+    obj = fake_bpy.new_object()
+    if build_mode == 'LIVE':
+        draw_live(obj, glyph_strokes)
+    else:
+        draw_glyph(obj, glyph_strokes)
+    return obj
+
+
+def emit_instanced(glyphs, font):
+    scene = bpy.context.scene
+    scene.frame_current = 1
+    obj = fake_bpy.new_object()
+    scene.collection.objects.link(obj)
+    draw_instanced(obj, [glyphs], font)
+    return obj
+
+
+def decorate(obj):
+    scene = bpy.context.scene
+    scene.gw_build_mode = 'LINEAR'
+    left, right, bottom, top = get_glyph_size(obj.data)
+    for style in DECORATOR_STYLES:
+        glyph_strokes = get_decorator_strokes(style, left, right, bottom, top, scene.gw_line_height)
+        scene.frame_current = 1
+        draw_glyph(fake_bpy.new_object(style), glyph_strokes)
+
+
+def run_font(font, corpora, repeat):
+    results = []
+    speed = bpy.context.scene.gw_speed / 10
+
+    for corpus, text in corpora.items():
+        def record(benchmark, function, **extra):
+            seconds = best_time(function, repeat)
+            result = {
+                "benchmark": benchmark,
+                "font": font,
+                "corpus": corpus,
+                "characters": len(text),
+                "seconds": seconds,
+            }
+            result.update(extra)
+            results.append(result)
+            print("{0:<10} {1:<24} {2:<10} {3:>10.4f} s".format(
+                benchmark + extra.get("mode", ""), font, corpus, seconds))
+
+        record("glyph_load", lambda: load_glyphs(font, text))
+
+        glyph_strokes, glyphs = layout_text(text, font)
+        record("layout", lambda: layout_text(text, font), strokes=len(glyph_strokes))
+        record("resample", lambda: resample(glyph_strokes, speed), strokes=len(glyph_strokes))
+
+        build_modes = ['LINEAR', 'LIVE']
+        if len(text) <= FULL_BUILD_LIMIT:
+            build_modes.append('FULL')
+        for build_mode in build_modes:
+            record("emit", lambda: emit(glyph_strokes, build_mode), mode="_" + build_mode.lower())
+        record("emit", lambda: emit_instanced(glyphs, font), mode="_instanced")
+
+        if len(glyph_strokes) > 0:
+            obj = emit(glyph_strokes, 'LINEAR')
+            record("decorate", lambda: decorate(obj))
+
+    return results
+
+
+def get_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT_FOLDER, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline):
+    """
+    Print how long each benchmark took relative to a baseline run
+    """
+    def key(result):
+        return (result["benchmark"], result.get("mode"), result["font"], result["corpus"])
+
+    old = {key(result): result["seconds"] for result in baseline["results"]}
+    print("\nCompared with " + str(baseline.get("commit")))
+    for result in results:
+        if key(result) in old:
+            ratio = result["seconds"] / old[key(result)]
+            print("{0:<10} {1:<24} {2:<10} {3:>7.2f}x".format(
+                result["benchmark"] + result.get("mode", ""), result["font"], result["corpus"], ratio))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Grease Writer pipeline")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="A JSON file from an earlier run to compare against")
+    parser.add_argument("--font", action="append", help="Only benchmark this font (repeatable)")
+    parser.add_argument("--corpus", action="append", choices=["word", "paragraph", "10k"],
+                        help="Only benchmark this corpus (repeatable)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark; the fastest is kept")
+    args = parser.parse_args()
+
+    fonts = args.font or sorted(font_props)
+
+    results = []
+    for font in fonts:
+        corpora = get_corpora(font)
+        if args.corpus:
+            corpora = {name: corpora[name] for name in args.corpus}
+        results.extend(run_font(font, corpora, args.repeat))
+
+    report = {
+        "commit": get_commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
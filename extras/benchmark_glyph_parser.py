@@ -0,0 +1,46 @@
+"""
+Compare the glyph parser against eval() on every bundled font.
+
+Run with: blender -b -P extras/benchmark_glyph_parser.py
+"""
+import os
+import sys
+import timeit
+
+operators_folder = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'operators')
+sys.path.insert(0, operators_folder)
+
+from utils import parse_glyph
+from utils.glyph_cache import FONTS_FOLDER
+
+
+def read_font(font):
+    folder = os.path.join(FONTS_FOLDER, font)
+    texts = []
+    for file_name in sorted(os.listdir(folder)):
+        if file_name.endswith('.glyph'):
+            with open(os.path.join(folder, file_name)) as f:
+                texts.append(f.read().strip().split('\n'))
+    return texts
+
+
+def eval_font(texts):
+    for lines in texts:
+        [eval(line) for line in lines]
+
+
+def parse_font(texts):
+    for lines in texts:
+        parse_glyph(lines)
+
+
+if __name__ == "__main__":
+    repeat = 5
+    for font in sorted(os.listdir(FONTS_FOLDER)):
+        if not os.path.isdir(os.path.join(FONTS_FOLDER, font)):
+            continue
+        texts = read_font(font)
+        eval_time = min(timeit.repeat(lambda: eval_font(texts), number=1, repeat=repeat))
+        parse_time = min(timeit.repeat(lambda: parse_font(texts), number=1, repeat=repeat))
+        print("{0:<24} eval: {1:8.2f} ms  parse_glyph: {2:8.2f} ms  ({3:.1f}x)".format(
+            font, eval_time * 1000, parse_time * 1000, eval_time / parse_time))
@@ -0,0 +1,20 @@
+"""
+Precompile every bundled font into a memory-mappable glyph pack.
+
+Run with: blender -b -P extras/build_font_packs.py
+"""
+import os
+import sys
+
+operators_folder = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'operators')
+sys.path.insert(0, operators_folder)
+
+from utils import build_font_pack
+from utils.glyph_cache import FONTS_FOLDER
+
+
+if __name__ == "__main__":
+    for font in sorted(os.listdir(FONTS_FOLDER)):
+        if os.path.isdir(os.path.join(FONTS_FOLDER, font)):
+            build_font_pack(font)
+            print("Packed " + font)
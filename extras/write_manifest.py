@@ -0,0 +1,51 @@
+"""
+Write every text of a CSV or JSON manifest as a grease pencil object.
+
+Run with:
+    blender -b scene.blend -P extras/write_manifest.py -- manifest.csv --output shot.blend
+
+See read_manifest in operators/utils/manifest.py for the manifest columns.
+"""
+import os
+import sys
+import argparse
+import importlib
+
+addon_folder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(addon_folder))
+
+
+def main():
+    # Batch workers import this script again without Blender, so bpy and
+    # the add-on are only imported once it runs
+    import bpy
+
+    addon = importlib.import_module(os.path.basename(addon_folder))
+    write_batch = importlib.import_module(addon.__name__ + '.operators.write_batch')
+    manifest = importlib.import_module(addon.__name__ + '.operators.utils.manifest')
+
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+
+    parser = argparse.ArgumentParser(prog="blender -b -P write_manifest.py --",
+                                     description="Write every text of a manifest")
+    parser.add_argument("manifest", help="A .csv or .json manifest")
+    parser.add_argument("--output", help="Save the .blend file here when done")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Processes to lay out the texts with; 0 uses one per core")
+    args = parser.parse_args(argv)
+
+    # The add-on isn't enabled when Blender runs without user preferences
+    if not hasattr(bpy.types.Scene, 'gw_font'):
+        addon.register()
+
+    items = manifest.read_manifest(args.manifest)
+    report = write_batch.write_manifest(bpy.context, items, args.workers or None)
+    for line in write_batch.format_report(report):
+        print(line)
+
+    if args.output:
+        bpy.ops.wm.save_as_mainfile(filepath=os.path.abspath(args.output))
+
+
+if __name__ == "__main__":
+    main()
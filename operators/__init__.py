@@ -1,5 +1,8 @@
 from .reanimate import GREASEPENCIL_OT_reanimate
 from .write import GREASEPENCIL_OT_write
+from .write_batch import GREASEPENCIL_OT_write_batch
 from .trace import GREASEPENCIL_OT_trace
 from .decorate import GREASEPENCIL_OT_decorate
 from .stippleit import GREASEPENCIL_OT_stippleit
+from .purge_materials import GREASEPENCIL_OT_purge_materials
+from .bake_live import GREASEPENCIL_OT_bake_live
@@ -0,0 +1,22 @@
+import bpy
+from .utils import bake_live
+
+class GREASEPENCIL_OT_bake_live(bpy.types.Operator):
+    bl_label = "Bake Live"
+    bl_idname = "grease_writer.bake_live"
+    bl_description = "Turn the live animation of a grease-pencil object into ordinary frames, for rendering without the add-on"
+    bl_options = {"REGISTER", "UNDO"}
+
+    @classmethod
+    def poll(self, context):
+        obj = bpy.context.view_layer.objects.active
+        if obj is not None and 'gw_live' in obj:
+            return True
+        else:
+            return False
+
+    def execute(self, context):
+        obj = bpy.context.view_layer.objects.active
+        bake_live(obj)
+
+        return {"FINISHED"}
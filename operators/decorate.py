@@ -2,7 +2,12 @@ import bpy
 import math
 import numpy as np
 from .utils import draw_glyph
-from .utils import process_stroke_verts_linearly
+from .utils import get_material
+from .utils import read_frame
+from .utils import get_travel_frames
+from .utils import get_live_schedule
+from .utils.draw_glyph import GLYPH_SIZE_PROP
+from .utils import StrokeSet
 
 def ellipse(t, a, b):
     return [a * math.cos(t), b * math.sin(t), 0]
@@ -24,26 +29,111 @@ def ellipse_points(origin_x, origin_y, a, b, count=100):
 def get_glyph_size(gpencil):
     """
     Get the size of a grease_pencil object
+
+    The points of the last frame are read in bulk with read_frame. The
+    result is cached on the grease pencil data until clear_glyph_size is
+    called, as every operator that rewrites the strokes does, or the last
+    frame or its number of strokes changes.
     """
     layer = gpencil.layers[0]
     frame = layer.frames[-1]
 
-    x_points = []
-    y_points = []
-    for stroke in frame.strokes:
-        for point in stroke.points:
-            x_points.append(point.co.x)
-            y_points.append(point.co.y)
+    key = [frame.frame_number, len(frame.strokes)]
+    cached = gpencil.get(GLYPH_SIZE_PROP)
+    if cached is not None and list(cached[:2]) == key:
+        return tuple(cached[2:])
+
+    coords = read_frame(frame).coords
 
-    min_x = min(x_points)
-    max_x = max(x_points)
+    min_x, min_y = (float(value) for value in coords[:, :2].min(axis=0))
+    max_x, max_y = (float(value) for value in coords[:, :2].max(axis=0))
 
-    min_y = min(y_points)
-    max_y = max(y_points)
+    gpencil[GLYPH_SIZE_PROP] = key + [min_x, max_x, min_y, max_y]
 
     return min_x, max_x, min_y, max_y
 
 
+def get_decorator_strokes(style, left, right, bottom, top, line_height):
+    """
+    Get the StrokeSet of a decorator around the given bounds, relative to
+    the center of the bounds
+    """
+    width = right - left
+    height = top - bottom
+
+    glyph_strokes = []
+
+    padding_fac = 0.125
+
+    origin_x = (width / 2) + left
+    origin_y = (height / 2) + bottom
+
+    if style == "underline":
+        v1 = [left - (line_height * padding_fac * 2) - origin_x, bottom - (line_height * padding_fac * 2) - origin_y, 0]
+        v2 = [right + (line_height * padding_fac * 2) - origin_x, bottom - (line_height * padding_fac * 2) - origin_y, 0]
+        glyph_strokes.append([v1, v2])
+
+    elif style == "over-underline":
+        v1 = [left - (line_height * padding_fac * 2) - origin_x, top + (line_height * padding_fac * 2) - origin_y, 0]
+        v2 = [right + (line_height * padding_fac * 2) - origin_x, top + (line_height * padding_fac * 2) - origin_y, 0]
+        glyph_strokes.append([v1, v2])
+
+        v1 = [left - (line_height * padding_fac * 2) - origin_x, bottom - (line_height * padding_fac * 2) - origin_y, 0]
+        v2 = [right + (line_height * padding_fac * 2) - origin_x, bottom - (line_height * padding_fac * 2) - origin_y, 0]
+        glyph_strokes.append([v1, v2])
+
+    elif style == "x-out":
+        v1 = [left - (line_height * padding_fac * 2) - origin_x, top + (line_height * padding_fac * 2) - origin_y, 0]
+        v2 = [right + (line_height * padding_fac * 2) - origin_x, top + (line_height * padding_fac * 2) - origin_y, 0]
+        v3 = [right + (line_height * padding_fac * 2) - origin_x, bottom - (line_height * padding_fac * 2) - origin_y, 0]
+        v4 = [left - (line_height * padding_fac * 2) - origin_x, bottom - (line_height * padding_fac * 2) - origin_y, 0]
+        glyph_strokes.append([v1, v3])
+        glyph_strokes.append([v2, v4])
+
+    elif style == "strike-through":
+        v1 = [left - (line_height * padding_fac * 2) - origin_x, bottom + (height / 2) - origin_y, 0]
+        v2 = [right + (line_height * padding_fac * 2) - origin_x, bottom + (height / 2) - origin_y, 0]
+        glyph_strokes.append([v1, v2])
+
+    elif style == "box":
+        v1 = [left - (line_height * padding_fac * 2) - origin_x, top + (line_height * padding_fac * 2) - origin_y, 0]
+        v2 = [right + (line_height * padding_fac * 2) - origin_x, top + (line_height * padding_fac * 2) - origin_y, 0]
+        v3 = [right + (line_height * padding_fac * 2) - origin_x, bottom - (line_height * padding_fac * 2) - origin_y, 0]
+        v4 = [left - (line_height * padding_fac * 2) - origin_x, bottom - (line_height * padding_fac * 2) - origin_y, 0]
+        glyph_strokes.append([v1, v2, v3, v4, v1])
+
+    elif style == "ellipse":
+        w_fac = height / width
+        h_fac = width / height
+
+        a = (width / 2) + (width * (padding_fac * 3) * w_fac)
+        b = (height / 2) + (height * (padding_fac * 3) * h_fac)
+        glyph_strokes.append(ellipse_points(0, 0, a, b))
+
+    elif style == "circle":
+        longer = max(width, height)
+        a = (longer / 2) + (longer * padding_fac)
+        b = (longer / 2) + (longer * padding_fac)
+        glyph_strokes.append(ellipse_points(0, 0, a, b))
+
+    elif style == "helioid":
+        w_fac = height / width
+        h_fac = width / height
+        a = (width / 2) + (width * (padding_fac * 3) * w_fac)
+        b = (height / 2) + (height * (padding_fac * 3) * h_fac)
+        glyph_strokes.append(ellipse_points(0, 0, a, b))
+
+        longer = max([a, b])
+
+        starts = ellipse_points(0, 0, a * (1 + padding_fac * 2), b * (1 + padding_fac * 2), count=12)
+        ends = ellipse_points(0, 0, a * (1 + padding_fac * 2) + (longer / 3), b * (1 + padding_fac * 2) + (longer / 3), count=12)
+
+        for i in range(len(starts)):
+            glyph_strokes.append([starts[i], ends[i]])
+
+    return StrokeSet.from_strokes(glyph_strokes)
+
+
 class GREASEPENCIL_OT_decorate(bpy.types.Operator):
     bl_label = "Decorate"
     bl_idname = "grease_writer.decorate"
@@ -67,7 +157,7 @@ class GREASEPENCIL_OT_decorate(bpy.types.Operator):
         gpencil = obj.data
 
         obj_name = obj.name
-        speed = scene.gw_speed
+        speed = scene.gw_speed / 10
         thickness = scene.gw_thickness
         line_height = scene.gw_line_height
 
@@ -79,95 +169,26 @@ class GREASEPENCIL_OT_decorate(bpy.types.Operator):
 
         style = gpencil.decorator_style
 
-        glyph_strokes = []
-
-        padding_fac = 0.125
-
         origin_x = (width / 2) + left
         origin_y = (height / 2) + bottom
 
-        if style == "underline":
-            v1 = [left - (line_height * padding_fac * 2) - origin_x, bottom - (line_height * padding_fac * 2) - origin_y, 0]
-            v2 = [right + (line_height * padding_fac * 2) - origin_x, bottom - (line_height * padding_fac * 2) - origin_y, 0]
-            glyph_strokes.append([v1, v2])
-
-        elif style == "over-underline":
-            v1 = [left - (line_height * padding_fac * 2) - origin_x, top + (line_height * padding_fac * 2) - origin_y, 0]
-            v2 = [right + (line_height * padding_fac * 2) - origin_x, top + (line_height * padding_fac * 2) - origin_y, 0]
-            glyph_strokes.append([v1, v2])
-
-            v1 = [left - (line_height * padding_fac * 2) - origin_x, bottom - (line_height * padding_fac * 2) - origin_y, 0]
-            v2 = [right + (line_height * padding_fac * 2) - origin_x, bottom - (line_height * padding_fac * 2) - origin_y, 0]
-            glyph_strokes.append([v1, v2])
-
-        elif style == "x-out":
-            v1 = [left - (line_height * padding_fac * 2) - origin_x, top + (line_height * padding_fac * 2) - origin_y, 0]
-            v2 = [right + (line_height * padding_fac * 2) - origin_x, top + (line_height * padding_fac * 2) - origin_y, 0]
-            v3 = [right + (line_height * padding_fac * 2) - origin_x, bottom - (line_height * padding_fac * 2) - origin_y, 0]
-            v4 = [left - (line_height * padding_fac * 2) - origin_x, bottom - (line_height * padding_fac * 2) - origin_y, 0]
-            glyph_strokes.append([v1, v3])
-            glyph_strokes.append([v2, v4])
-
-        elif style == "strike-through":
-            v1 = [left - (line_height * padding_fac * 2) - origin_x, bottom + (height / 2) - origin_y, 0]
-            v2 = [right + (line_height * padding_fac * 2) - origin_x, bottom + (height / 2) - origin_y, 0]
-            glyph_strokes.append([v1, v2])
-
-        elif style == "box":
-            v1 = [left - (line_height * padding_fac * 2) - origin_x, top + (line_height * padding_fac * 2) - origin_y, 0]
-            v2 = [right + (line_height * padding_fac * 2) - origin_x, top + (line_height * padding_fac * 2) - origin_y, 0]
-            v3 = [right + (line_height * padding_fac * 2) - origin_x, bottom - (line_height * padding_fac * 2) - origin_y, 0]
-            v4 = [left - (line_height * padding_fac * 2) - origin_x, bottom - (line_height * padding_fac * 2) - origin_y, 0]
-            glyph_strokes.append([v1, v2, v3, v4, v1])
-
-        elif style == "ellipse":
-            w_fac = height / width
-            h_fac = width / height
-
-            a = (width / 2) + (width * (padding_fac * 3) * w_fac)
-            b = (height / 2) + (height * (padding_fac * 3) * h_fac)
-            glyph_strokes.append(ellipse_points(0, 0, a, b))
-
-        elif style == "circle":
-            if width > height:
-                longer = width
-            elif height > width:
-                longer = height
-            a = (longer / 2) + (longer * padding_fac)
-            b = (longer / 2) + (longer * padding_fac)
-            glyph_strokes.append(ellipse_points(0, 0, a, b))
-
-        elif style == "helioid":
-            if width > height:
-                w_fac = height / width
-                h_fac = width / height
-            a = (width / 2) + (width * (padding_fac * 3) * w_fac)
-            b = (height / 2) + (height * (padding_fac * 3) * h_fac)
-            glyph_strokes.append(ellipse_points(0, 0, a, b))
-
-            longer = max([a, b])
-
-            starts = ellipse_points(0, 0, a * (1 + padding_fac * 2), b * (1 + padding_fac * 2), count=12)
-            ends = ellipse_points(0, 0, a * (1 + padding_fac * 2) + (longer / 3), b * (1 + padding_fac * 2) + (longer / 3), count=12)
-
-            for i in range(len(starts)):
-                glyph_strokes.append([starts[i], ends[i]])
-
+        glyph_strokes = get_decorator_strokes(style, left, right, bottom, top, line_height)
 
         last_point = gpencil.layers[0].frames[-1].strokes[-1].points[-1]
         last_vert = [last_point.co.x, last_point.co.y, 0]
-        new_vert = glyph_strokes[0][0]
-        count = len(process_stroke_verts_linearly([last_vert, new_vert], speed)) - 1
+        # The decorator strokes are relative to its origin
+        new_vert = [glyph_strokes[0][0][0] + origin_x, glyph_strokes[0][0][1] + origin_y, 0]
+        count = get_travel_frames(last_vert, new_vert, speed)
 
-        bpy.context.scene.frame_current = gpencil.layers[0].frames[-1].frame_number + count
+        # A live drawing keeps its strokes on its start frame
+        if 'gw_live' in obj:
+            frame_end = get_live_schedule(obj)["frame_end"]
+        else:
+            frame_end = gpencil.layers[0].frames[-1].frame_number
+        bpy.context.scene.frame_current = frame_end + count
 
-        new_gpencil = bpy.data.grease_pencil.new('gpencil')
-        color = scene.gw_color
-        new_mat = bpy.data.materials.new('decorator')
-        bpy.data.materials.create_gpencil_data(new_mat)
-        new_mat.grease_pencil.color[0] = color[0]
-        new_mat.grease_pencil.color[1] = color[1]
-        new_mat.grease_pencil.color[2] = color[2]
+        new_gpencil = bpy.data.grease_pencils.new('gpencil')
+        new_mat = get_material('decorator', scene.gw_color)
 
         new_obj = bpy.data.objects.new(obj_name + '_' + style, new_gpencil)
         bpy.context.scene.collection.objects.link(new_obj)
@@ -0,0 +1,13 @@
+import bpy
+from .utils import purge_materials
+
+class GREASEPENCIL_OT_purge_materials(bpy.types.Operator):
+    bl_label = "Purge Materials"
+    bl_idname = "grease_writer.purge_materials"
+    bl_description = "Remove the Grease Writer materials that are no longer used by any object"
+    bl_options = {"REGISTER", "UNDO"}
+
+    def execute(self, context):
+        count = purge_materials()
+        self.report({"INFO"}, "Removed " + str(count) + " unused materials")
+        return {"FINISHED"}
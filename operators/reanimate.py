@@ -1,5 +1,8 @@
 import bpy
 from .utils import draw_glyph
+from .utils import draw_layers
+from .utils import read_frame
+from .utils.instance_glyphs import INSTANCE_TAG
 
 class GREASEPENCIL_OT_reanimate(bpy.types.Operator):
     bl_label = "Reanimate"
@@ -11,6 +14,9 @@ class GREASEPENCIL_OT_reanimate(bpy.types.Operator):
     def poll(self, context):
         obj = bpy.context.view_layer.objects.active
         gpencil = obj.data
+        # A glyph instance shares its strokes with every other occurrence
+        if INSTANCE_TAG in obj:
+            return False
         if (len(gpencil.layers) > 0 and
             len(gpencil.layers[0].frames) > 0):
                 return True
@@ -21,16 +27,12 @@ class GREASEPENCIL_OT_reanimate(bpy.types.Operator):
         obj = bpy.context.view_layer.objects.active
         gpencil = obj.data
 
-        thicknesses = []
+        if gpencil.reanimate_layers != 'FIRST':
+            draw_layers(obj, gpencil.reanimate_layers)
+            return {"FINISHED"}
+
         layer = gpencil.layers[0]
-        frame = layer.frames[-1]
-        glyph_strokes = []
-        for stroke in frame.strokes:
-            verts = []
-            thicknesses.append(stroke.line_width)
-            for point in stroke.points:
-                verts.append([point.co.x, point.co.y, point.co.z])
-            glyph_strokes.append(verts)
+        strokes = read_frame(layer.frames[-1])
 
         layer.clear()
         try:
@@ -38,6 +40,6 @@ class GREASEPENCIL_OT_reanimate(bpy.types.Operator):
         except IndexError:
             pass
 
-        draw_glyph(obj, glyph_strokes, thicknesses=thicknesses)
+        draw_glyph(obj, strokes, thicknesses=strokes.line_widths, material_indices=strokes.material_indices)
 
         return {"FINISHED"}
@@ -1,5 +1,10 @@
 import bpy
-from .utils import process_stroke_verts_linearly
+from .utils import read_frame
+from .utils import stipple_strokes
+from .utils import clear_glyph_size
+from .utils import renew_live_schedule
+from .utils import update_live_object
+from .utils.instance_glyphs import INSTANCE_TAG
 
 
 class GREASEPENCIL_OT_stippleit(bpy.types.Operator):
@@ -12,7 +17,11 @@ class GREASEPENCIL_OT_stippleit(bpy.types.Operator):
     def poll(self, context):
         obj = bpy.context.view_layer.objects.active
         gpencil = obj.data
-        if len(gpencil.layers) > 0:
+        # A glyph instance shares its strokes with every other occurrence
+        if INSTANCE_TAG in obj:
+            return False
+        if (len(gpencil.layers) > 0 and
+            len(gpencil.layers[0].frames) > 0):
                 return True
         else:
             return False
@@ -24,47 +33,20 @@ class GREASEPENCIL_OT_stippleit(bpy.types.Operator):
 
         stipple_length = gpencil.stipple_length
 
-        thicknesses = []
         layer = gpencil.layers[0]
-        frame = layer.frames[-1]
-        glyph_strokes = []
-        for stroke in frame.strokes:
-            verts = []
-            thicknesses.append(stroke.line_width)
-            for point in stroke.points:
-                verts.append([point.co.x, point.co.y, point.co.z])
-            glyph_strokes.append(verts)
+        strokes = read_frame(layer.frames[-1])
 
         layer.clear()
+        clear_glyph_size(gpencil)
 
-        stippled_strokes = []
-        remaining = 0
-        x = 0
         stipple_skip = gpencil.stipple_skip + 1
-        for i in range(len(glyph_strokes)):
-            stroke_verts = glyph_strokes[i]
-            framed_strokes, remaining = process_stroke_verts_linearly(stroke_verts, stipple_length, remaining=remaining, stipple=True)
-
-            if x % stipple_skip > 0:
-                x %= stipple_skip
-            else:
-                x = 0
-            while x < len(framed_strokes):
-                if x % stipple_skip == 0:
-                    stippled_strokes.append(framed_strokes[x])
-                x += 1
+        dashes = stipple_strokes(strokes, stipple_length, stipple_skip)
 
         frame = layer.frames.new(0)
-        for stroke_verts in stippled_strokes:
-            stroke = frame.strokes.new()
-            stroke.line_width = thicknesses[i]
-            stroke.display_mode = '3DSPACE'
-
-            for vert in stroke_verts:
-                stroke.points.add(1)
-                stroke.points[-1].co.x = vert[0]
-                stroke.points[-1].co.y = vert[1]
-                stroke.points[-1].co.z = vert[2]
+        dashes.emit(frame)
 
+        if 'gw_live' in obj:
+            renew_live_schedule(obj)
+            update_live_object(obj, scene.frame_current)
 
         return {"FINISHED"}
@@ -1,4 +1,54 @@
 import bpy
+import numpy as np
+from .utils import keyframe_location
+from .utils import get_pen_path
+from .utils import read_frame
+
+
+def get_baked_path(layer):
+    """
+    Get the pen position on every baked frame of a layer, at the frame
+    before it is shown
+    """
+    frames = []
+    locations = []
+    for i in range(len(layer.frames)):
+        frame = layer.frames[i]
+        if i == 1:
+            frames.append(frame.frame_number - 1)
+            locations.append(frame.strokes[-1].points[0].co[:])
+
+        if (len(frame.strokes) > 0):
+            frames.append(frame.frame_number - 1)
+            locations.append(frame.strokes[-1].points[-1].co[:])
+
+    return frames, locations
+
+
+def get_drawing_start(obj, layer):
+    """
+    Get the frame the drawing of obj starts on, which earlier keyframes
+    kept by a multi-layer reanimate may come before
+    """
+    if 'gw_live' in obj:
+        return obj['gw_live']['frame_start']
+    if 'gw_frame_start' in obj:
+        return obj['gw_frame_start']
+    return layer.frames[0].frame_number
+
+
+def get_analytic_path(layer, speed, frame_start):
+    """
+    Get the same path as get_baked_path from the strokes of the layer's
+    last frame, which holds the whole drawing, and the draw speed
+
+    This only reads the last frame, so it takes time proportional to the
+    number of vertices rather than frames x strokes.
+    """
+    strokes = read_frame(layer.frames[-1])
+    frames, positions = get_pen_path(strokes, speed, frame_start)
+    return frames - 1, positions
+
 
 class GREASEPENCIL_OT_trace(bpy.types.Operator):
     bl_label = "Trace"
@@ -24,29 +74,19 @@ class GREASEPENCIL_OT_trace(bpy.types.Operator):
 
         tracer = bpy.data.objects[gpencil.tracer_obj]
 
-        for i in range(len(layer.frames)):
-            frame = layer.frames[i]
-            if i == 1:
-                vertex = frame.strokes[-1].points[0]
-                tracer.location[0] = vertex.co.x + obj.location[0]
-                tracer.location[1] = vertex.co.y + obj.location[1]
-                tracer.keyframe_insert(data_path="location", index=0, frame=frame.frame_number - 1)
-                tracer.keyframe_insert(data_path="location", index=1, frame=frame.frame_number - 1)
-
-                if not gpencil.trace2d:
-                    tracer.location[2] = vertex.co.z + obj.location[2]
-                    tracer.keyframe_insert(data_path="location", index=2, frame=frame.frame_number - 1)
-
-            if (len(frame.strokes) > 0):
-                vertex = frame.strokes[-1].points[-1]
-                tracer.location[0] = vertex.co.x + obj.location[0]
-                tracer.location[1] = vertex.co.y + obj.location[1]
-                tracer.keyframe_insert(data_path="location", index=0, frame=frame.frame_number - 1)
-                tracer.keyframe_insert(data_path="location", index=1, frame=frame.frame_number - 1)
-
-                if not gpencil.trace2d:
-                    tracer.location[2] = vertex.co.z + obj.location[2]
-                    tracer.keyframe_insert(data_path="location", index=2, frame=frame.frame_number - 1)
+        # A live drawing has no baked frames to read, but it keeps the speed
+        # it was written with
+        if 'gw_live' in obj:
+            speed = obj['gw_live']['speed'] / 10
+            frames, locations = get_analytic_path(layer, speed, get_drawing_start(obj, layer))
+        elif gpencil.trace_analytic:
+            speed = bpy.context.scene.gw_speed / 10
+            frames, locations = get_analytic_path(layer, speed, get_drawing_start(obj, layer))
+        else:
+            frames, locations = get_baked_path(layer)
+
+        locations = np.array(locations, dtype=np.float32).reshape(-1, 3) + tuple(obj.location)
+        keyframe_location(tracer, frames, locations, gpencil.trace2d)
 
         return {"FINISHED"}
 
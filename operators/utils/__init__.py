@@ -1,3 +1,23 @@
 from .distance_formula import distance_formula
 from .process_stroke_verts_linearly import process_stroke_verts_linearly
-from .draw_glyph import draw_glyph
+from .draw_glyph import draw_glyph, draw_framed_strokes, clear_glyph_size
+from .draw_layers import draw_layers, get_stroke_order
+from .emit_stroke import emit_stroke
+from .stroke_set import StrokeSet
+from .read_frame import read_frame
+from .get_char_name import get_char_name
+from .glyph_cache import load_glyph, clear_glyph_cache, build_font_pack
+from .glyph_cache import get_glyph_metrics, build_font_metrics
+from .parse_glyph import parse_glyph, read_glyph_file
+from .resample_stroke import resample_stroke, insert_tips, iter_framed_strokes, get_travel_frames
+from .layout import layout_text, iter_layout, iter_line_glyphs, iter_glyph_strokes
+from .keyframe_location import keyframe_location
+from .pen_path import get_pen_path
+from .batch import batch_frame_texts, frame_text, pack_framed_strokes, unpack_framed_strokes
+from .manifest import read_manifest
+from .get_material import get_material, purge_materials
+from .live import draw_live, bake_live, update_live_objects, update_live_object, renew_live_schedule
+from .live import get_live_schedule
+from .simplify_stroke import simplify_stroke
+from .stipple_strokes import stipple_strokes
+from .instance_glyphs import draw_instanced, remove_glyph_instances
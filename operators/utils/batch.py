@@ -0,0 +1,136 @@
+import os
+import runpy
+import multiprocessing
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from .layout import layout_text
+from .resample_stroke import iter_framed_strokes
+from .stroke_set import StrokeSet
+
+# Run by every spawned worker to import this package without bpy
+WORKER_SETUP = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'batch_worker.py')
+
+
+def pack_framed_strokes(framed_strokes):
+    """
+    Flatten resampled strokes into a few compact arrays that are cheap to
+    send between processes
+
+    Parameters
+    ----------
+    framed_strokes: iterable
+        The strokes as yielded by iter_framed_strokes
+
+    Returns
+    -------
+    packed: dict
+        "merged", a StrokeSet of the vertices and cut points of every
+        stroke; "frame_ends" and "frame_offsets", the int32 frame ends of
+        every stroke one after another and the len(strokes) + 1 boundaries
+        of each stroke's; and "gaps", the int32 pen travel frames before
+        each stroke
+    """
+    merged = []
+    frame_ends = []
+    gaps = []
+    for coords, stroke_merged, stroke_frame_ends, gap in framed_strokes:
+        merged.append(stroke_merged)
+        frame_ends.append(stroke_frame_ends)
+        gaps.append(gap)
+
+    def get_offsets(chunks):
+        offsets = np.zeros(len(chunks) + 1, dtype=np.int32)
+        np.cumsum([len(chunk) for chunk in chunks], out=offsets[1:])
+        return offsets
+
+    return {
+        "merged": StrokeSet.from_strokes(merged),
+        "frame_ends": np.concatenate(frame_ends).astype(np.int32) if frame_ends else np.zeros(0, dtype=np.int32),
+        "frame_offsets": get_offsets(frame_ends),
+        "gaps": np.array(gaps, dtype=np.int32),
+    }
+
+
+def unpack_framed_strokes(packed):
+    """
+    Yield the strokes of pack_framed_strokes again, in the form of
+    iter_framed_strokes, so they can be passed to draw_framed_strokes
+    """
+    merged = packed["merged"]
+    frame_ends = packed["frame_ends"]
+    frame_offsets = packed["frame_offsets"]
+
+    for i, gap in enumerate(packed["gaps"]):
+        stroke_merged = merged[i]
+        stroke_frame_ends = frame_ends[frame_offsets[i]:frame_offsets[i + 1]].tolist()
+        # Every frame end but the last is one past a cut point
+        coords = np.delete(stroke_merged, np.asarray(stroke_frame_ends[:-1], dtype=int) - 1, axis=0)
+        yield coords, stroke_merged, stroke_frame_ends, int(gap)
+
+
+def frame_text(job):
+    """
+    Lay out and resample one text; the work done by each batch worker
+
+    Parameters
+    ----------
+    job: dict
+        "text" and "font", and optionally "kerning", "word_space",
+        "line_height", "tolerance" and "speed", as for layout_text and
+        iter_framed_strokes. speed is the distance per frame, the scene's
+        draw speed / 10, and defaults to 0.1
+
+    Returns
+    -------
+    packed: dict
+        See pack_framed_strokes
+    """
+    glyph_strokes, glyphs = layout_text(
+        job["text"],
+        job["font"],
+        job.get("kerning", 1.0),
+        job.get("word_space", 1.0),
+        job.get("line_height", 1.0),
+        job.get("tolerance", 0),
+    )
+    return pack_framed_strokes(iter_framed_strokes(glyph_strokes, job.get("speed", 0.1)))
+
+
+def batch_frame_texts(jobs, max_workers=1):
+    """
+    Lay out and resample many texts, such as the cards of a subtitle file,
+    optionally across a pool of processes
+
+    Each text is one unit of work, since the distance left over at the end
+    of every stroke carries into the next one. Only the packed arrays come
+    back, so emitting them with draw_framed_strokes is all that is left for
+    Blender's main thread.
+
+    Workers are always spawned, never forked, since forking a process that
+    runs other threads, as Blender does, can deadlock. Spawned workers run
+    without Blender, so batch_worker.py lets them import this package
+    without the add-on's __init__, and the script that started Blender must
+    not import bpy at its top, since spawning imports it again.
+
+    Parameters
+    ----------
+    jobs: list of dict
+        See frame_text
+    max_workers: int or None
+        The number of processes; 1, the default, runs every job in this
+        process, and None uses one per core
+
+    Returns
+    -------
+    packed: list of dict
+        The result of frame_text for each job, in order
+    """
+    jobs = list(jobs)
+    if max_workers == 1 or len(jobs) < 2:
+        return [frame_text(job) for job in jobs]
+
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context, initializer=runpy.run_path,
+                             initargs=(WORKER_SETUP, {"utils_package": __package__})) as executor:
+        chunksize = max(1, len(jobs) // (4 * (max_workers or multiprocessing.cpu_count())))
+        return list(executor.map(frame_text, jobs, chunksize=chunksize))
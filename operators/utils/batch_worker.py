@@ -0,0 +1,27 @@
+"""
+Run by each spawned batch worker before its first job; see batch_frame_texts
+
+A job names its function by the full module path, such as
+GreaseWriter.operators.utils.batch. Importing that would first run the
+add-on's __init__ and the operators', which import bpy, and bpy only
+exists inside Blender. The packages above utils are registered here as
+empty packages, so the worker imports utils on its own; none of its modules
+import bpy until they are called.
+
+The full name of the utils package is passed in as utils_package.
+"""
+import os
+import sys
+import types
+
+names = utils_package.split('.')
+folder = os.path.dirname(os.path.abspath(__file__))
+
+for i in range(len(names) - 1, 0, -1):
+    folder = os.path.dirname(folder)
+    name = '.'.join(names[:i])
+    if name not in sys.modules:
+        package = types.ModuleType(name)
+        package.__path__ = [folder]
+        package.__package__ = name
+        sys.modules[name] = package
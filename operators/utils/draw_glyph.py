@@ -1,84 +1,266 @@
-import bpy
-from .process_stroke_verts_linearly import process_stroke_verts_linearly
+import itertools
+import numpy as np
+from .resample_stroke import iter_framed_strokes
+from .emit_stroke import emit_stroke
+from .read_frame import read_frame
+
+# In linear build mode, finished strokes are grouped onto layers holding at
+# most this many strokes each, so every keyframe stays a constant size.
+# The layers Grease Writer makes are named under 'gw.', so layers of the
+# user's are never mistaken for them
+FINISHED_CHUNK = 32
+FINISHED_PREFIX = 'gw.finished.'
+
+# In live mode, the layer that a frame change handler draws onto
+LIVE_LAYER = 'gw.live'
+
+# The custom property that Decorate caches the bounds of a drawing in
+GLYPH_SIZE_PROP = 'gw_glyph_size'
+
+
+def is_finished_layer(layer):
+    """
+    Check whether a layer is one of the finished-stroke layers of a linear
+    build
+    """
+    name = layer.info
+    chunk = name[len(FINISHED_PREFIX):]
+    return name.startswith(FINISHED_PREFIX) and chunk.isdigit()
+
+
+def remove_finished_layers(gpencil):
+    """
+    Remove the finished-stroke layers left behind by a linear build
+    """
+    for layer in list(gpencil.layers):
+        if is_finished_layer(layer):
+            gpencil.layers.remove(layer)
+
+
+def remove_live_layer(obj):
+    """
+    Turn a live object back into a plain one, see draw_live
+    """
+    gpencil = obj.data
+    layer = gpencil.layers.get(LIVE_LAYER)
+    if layer is not None:
+        gpencil.layers.remove(layer)
+    if len(gpencil.layers) > 0:
+        gpencil.layers[0].hide = False
+    if 'gw_live' in obj:
+        del obj['gw_live']
+
+
+def clear_glyph_size(gpencil):
+    """
+    Drop the bounds Decorate cached for gpencil; needed whenever its strokes
+    are rewritten
+    """
+    if GLYPH_SIZE_PROP in gpencil:
+        del gpencil[GLYPH_SIZE_PROP]
+
+
+def get_finished_layers(gpencil):
+    """
+    Get the finished-stroke layers of a linear build, in chunk order
+    """
+    layers = [layer for layer in gpencil.layers if is_finished_layer(layer)]
+    layers.sort(key=lambda layer: int(layer.info[len(FINISHED_PREFIX):]))
+    return layers
+
+
+def remove_frames_from(layer, frame_number):
+    """
+    Remove every keyframe of a layer at or after frame_number
+    """
+    for frame in list(layer.frames):
+        if frame.frame_number >= frame_number:
+            layer.frames.remove(frame)
+
+
+def new_frame(layer, frame_number):
+    """
+    Get an empty keyframe at frame_number, reusing one that already exists
+    """
+    for frame in layer.frames:
+        if frame.frame_number == frame_number:
+            for stroke in list(frame.strokes):
+                frame.strokes.remove(stroke)
+            return frame
+    return layer.frames.new(frame_number)
+
+
+def copy_strokes(source, target):
+    """
+    Copy every stroke of one frame into another
+    """
+    read_frame(source).emit(target)
+
+
+def repeats_last_point(merged, start, stop):
+    """
+    Whether merged[start:stop] only repeats the point before it, as it is
+    stored in float32, so a frame adding those points shows nothing new
+    """
+    if start < 1 or stop <= start:
+        return False
+    return bool((merged[start:stop].astype(np.float32) == merged[start - 1].astype(np.float32)).all())
+
+
+def draw_glyph(obj, glyph_strokes, thicknesses=None, first_stroke=0, material_indices=None):
+    """
+    Animate glyph_strokes on the first layer of obj, one frame at a time
+
+    glyph_strokes may be a StrokeSet or any iterable of strokes. See
+    draw_framed_strokes
+    """
+    import bpy
+
+    speed = bpy.context.scene.gw_speed / 10
+    framed_strokes = iter_framed_strokes(glyph_strokes, speed)
+    draw_framed_strokes(obj, framed_strokes, thicknesses, first_stroke, material_indices)
+
+
+def draw_framed_strokes(obj, framed_strokes, thicknesses=None, first_stroke=0, material_indices=None):
+    """
+    Animate strokes that are already resampled, as from iter_framed_strokes
+    or unpack_framed_strokes, on the first layer of obj
+
+    framed_strokes, thicknesses and material_indices may be any iterables,
+    such as generators, and are consumed one stroke at a time. Without
+    thicknesses every stroke is scene.gw_thickness wide, and without
+    material_indices every stroke uses the first material slot.
+
+    With scene.gw_build_mode set to 'LINEAR', every animation frame on the
+    first layer only holds the stroke that is being drawn. Completed strokes
+    are keyed once onto "finished" layers, so the number of points stored
+    grows linearly with the text instead of with frames x strokes, and only
+    one layer's worth of strokes is kept in memory. The last frame still
+    holds every stroke on the first layer.
+
+    When first_stroke is given, the frames of the strokes before it are
+    assumed to be on the layers already, from an earlier call with the same
+    strokes and scene.frame_current. Those strokes are only replayed to find
+    their timing, and the frames from the last one onward are rebuilt.
+    """
+    import bpy
 
-def draw_glyph(obj, glyph_strokes, thicknesses=None):
     scene = bpy.context.scene
     gpencil = obj.data
-    speed = scene.gw_speed / 10
     thickness = scene.gw_thickness
+    linear = scene.gw_build_mode == 'LINEAR'
+
+    if thicknesses is None:
+        thicknesses = itertools.repeat(thickness)
+    thicknesses = iter(thicknesses)
+    if material_indices is None:
+        material_indices = itertools.repeat(0)
+    material_indices = iter(material_indices)
 
     if len(gpencil.layers) > 0:
             layer = gpencil.layers[0]
-            layer.clear()
     else:
         layer = gpencil.layers.new('strokes', set_active=True)
 
-    frame = layer.frames.new(bpy.context.scene.frame_current)
+    clear_glyph_size(gpencil)
+
+    # Frames are only written from this frame number onward
+    if first_stroke == 0:
+        layer.clear()
+        remove_finished_layers(gpencil)
+        remove_live_layer(obj)
+        finished_layers = []
+        emit_from = bpy.context.scene.frame_current
+        frame = layer.frames.new(bpy.context.scene.frame_current)
+        # Where the drawing starts, which earlier keyframes may come before
+        obj['gw_frame_start'] = bpy.context.scene.frame_current
+    else:
+        finished_layers = get_finished_layers(gpencil)
+        emit_from = None
 
     bpy.context.scene.frame_current += 1
 
-    mat_index = None
-    remaining = 0
-    for i in range(len(glyph_strokes)):
-        stroke_verts = glyph_strokes[i]
-        framed_strokes, remaining = process_stroke_verts_linearly(stroke_verts, speed, remaining=remaining)
+    # The strokes drawn so far that later frames still need to repeat; in
+    # linear mode, only those of the current finished layer
+    drawn = []
+
+    framed_strokes = iter(framed_strokes)
+    current = next(framed_strokes, None)
+    i = 0
+    while current is not None:
+        coords, merged, frame_ends, gap = current
+        line_width = next(thicknesses)
+        material_index = next(material_indices)
+        upcoming = next(framed_strokes, None)
 
         # Give extra frames between strokes
-        if i > 0:
-            last_vert = glyph_strokes[i - 1][-1]
-            new_vert = glyph_strokes[i][0]
-            count = len(process_stroke_verts_linearly([last_vert, new_vert], speed)) - 1
-            bpy.context.scene.frame_current += count
+        bpy.context.scene.frame_current += gap
+
+        if i == first_stroke - 1:
+            # The frames of this stroke are the last to change when a later
+            # stroke changes; once it ends, everything after is rebuilt
+            emit_from = bpy.context.scene.frame_current + len(frame_ends) - 1
+            remove_frames_from(layer, emit_from)
+            for finished_layer in list(finished_layers):
+                remove_frames_from(finished_layer, emit_from)
+                if len(finished_layer.frames) == 0:
+                    finished_layers.remove(finished_layer)
+                    gpencil.layers.remove(finished_layer)
+
+        emitting = emit_from is not None and bpy.context.scene.frame_current >= emit_from
+
+        if linear and i > 0 and emitting:
+            # Key the stroke that just finished onto its chunk layer
+            chunk = (i - 1) // FINISHED_CHUNK
+            if chunk == len(finished_layers):
+                name = FINISHED_PREFIX + str(chunk).zfill(3)
+                finished_layers.append(gpencil.layers.new(name, set_active=False))
+            frame = finished_layers[chunk].frames.new(bpy.context.scene.frame_current)
+            for prev_coords, prev_width, prev_material in drawn:
+                emit_stroke(frame, prev_coords, prev_width, material_index=prev_material)
+
+        if linear and i > 0 and i % FINISHED_CHUNK == 0:
+            drawn = []
 
         stopper = 0
-        if i == len(glyph_strokes) - 1:
+        if upcoming is None:
             stopper = 1
 
-        for x in range(len(framed_strokes) - stopper):
+        for x in range(len(frame_ends) - stopper):
+            if emit_from is None or bpy.context.scene.frame_current < emit_from:
+                bpy.context.scene.frame_current += 1
+                continue
+
+            if x > 0 and repeats_last_point(merged, frame_ends[x - 1], frame_ends[x]):
+                # Grease pencil holds the previous keyframe, which already
+                # looks the same
+                bpy.context.scene.frame_current += 1
+                continue
+
             frame = layer.frames.new(bpy.context.scene.frame_current)
 
-            for y in range(i):
-                stroke = frame.strokes.new()
-                if thicknesses == None:
-                    stroke.line_width = thickness
-                else:
-                    stroke.line_width = thicknesses[i]
-                stroke.display_mode = '3DSPACE'
-
-                for vert in glyph_strokes[y]:
-                    stroke.points.add(1)
-                    stroke.points[-1].co.x = vert[0]
-                    stroke.points[-1].co.y = vert[1]
-                    stroke.points[-1].co.z = vert[2]
-
-            stroke = frame.strokes.new()
-            if thicknesses == None:
-                stroke.line_width = thickness
-            else:
-                stroke.line_width = thicknesses[i]
-            stroke.display_mode = '3DSPACE'
-
-            for vert in framed_strokes[x]:
-                stroke.points.add(1)
-                stroke.points[-1].co.x = vert[0]
-                stroke.points[-1].co.y = vert[1]
-                stroke.points[-1].co.z = vert[2]
+            if not linear:
+                for prev_coords, prev_width, prev_material in drawn:
+                    emit_stroke(frame, prev_coords, prev_width, material_index=prev_material)
+
+            emit_stroke(frame, merged[:frame_ends[x]], line_width, material_index=material_index)
 
             bpy.context.scene.frame_current += 1
 
+        drawn.append((coords, line_width, material_index))
+        current = upcoming
+        i += 1
+
     frame = layer.frames.new(bpy.context.scene.frame_current)
-    for i in range(len(glyph_strokes)):
-        stroke_verts = glyph_strokes[i]
-        stroke = frame.strokes.new()
-        if thicknesses == None:
-            stroke.line_width = thickness
-        else:
-            stroke.line_width = thicknesses[i]
-        stroke.display_mode = '3DSPACE'
-
-        for vert in stroke_verts:
-            stroke.points.add(1)
-            stroke.points[-1].co.x = vert[0]
-            stroke.points[-1].co.y = vert[1]
-            stroke.points[-1].co.z = vert[2]
+    if linear:
+        # Every stroke but the last one is already on a finished layer
+        for finished_layer in finished_layers:
+            copy_strokes(finished_layer.frames[-1], frame)
+        drawn = drawn[-1:]
+
+    for stroke_coords, stroke_width, stroke_material in drawn:
+        emit_stroke(frame, stroke_coords, stroke_width, material_index=stroke_material)
 
+    # The first layer now shows everything, so hide the finished layers
+    for finished_layer in finished_layers:
+        new_frame(finished_layer, bpy.context.scene.frame_current)
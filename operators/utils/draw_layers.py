@@ -0,0 +1,111 @@
+from .resample_stroke import iter_framed_strokes
+from .emit_stroke import emit_stroke
+from .read_frame import read_frame
+from .draw_glyph import LIVE_LAYER, is_finished_layer
+from .draw_glyph import remove_finished_layers, remove_live_layer, remove_frames_from, repeats_last_point
+from .draw_glyph import clear_glyph_size
+
+
+def get_stroke_order(counts, rule):
+    """
+    Decide in which order the strokes of several layers are drawn
+
+    Parameters
+    ----------
+    counts: list of int
+        The number of strokes on each layer
+    rule: str
+        'SEQUENCE' draws every stroke of a layer before the next layer;
+        'INTERLEAVE' draws one stroke of each layer in turn, until every
+        layer is done
+
+    Returns
+    -------
+    order: list of tuple
+        The (layer index, stroke index) of every stroke, in drawing order
+    """
+    if rule == 'SEQUENCE':
+        return [(l, s) for l, count in enumerate(counts) for s in range(count)]
+    elif rule == 'INTERLEAVE':
+        return [(l, s) for s in range(max(counts, default=0)) for l, count in enumerate(counts) if s < count]
+    else:
+        raise ValueError("Unknown stroke order '" + str(rule) + "'")
+
+
+def get_drawing_layers(gpencil):
+    """
+    Get the layers that hold the drawing itself, leaving out the ones that
+    linear and live builds add
+    """
+    return [
+        layer for layer in gpencil.layers
+        if not is_finished_layer(layer) and layer.info != LIVE_LAYER and len(layer.frames) > 0
+    ]
+
+
+def draw_layers(obj, rule):
+    """
+    Animate the strokes of every layer of obj together, keeping each
+    stroke on the layer it came from
+
+    The last frame of each layer is taken as its finished drawing. All the
+    strokes share one timeline, in the order given by rule, with the pen
+    travelling from each stroke to the next as in draw_glyph. A layer is
+    only keyed while one of its own strokes is drawn, and shows its own
+    strokes so far on those keys. Keyframes before scene.frame_current are
+    kept.
+    """
+    import bpy
+
+    scene = bpy.context.scene
+    gpencil = obj.data
+    speed = scene.gw_speed / 10
+
+    layers = get_drawing_layers(gpencil)
+    sources = [read_frame(layer.frames[-1]) for layer in layers]
+    order = get_stroke_order([len(strokes) for strokes in sources], rule)
+
+    remove_finished_layers(gpencil)
+    remove_live_layer(obj)
+    clear_glyph_size(gpencil)
+
+    frame_start = scene.frame_current
+    for layer in layers:
+        remove_frames_from(layer, frame_start)
+        layer.frames.new(frame_start)
+    obj['gw_frame_start'] = frame_start
+    scene.frame_current += 1
+
+    drawn = [[] for layer in layers]
+    glyph_strokes = (sources[l][s] for l, s in order)
+    for (l, s), framed_stroke in zip(order, iter_framed_strokes(glyph_strokes, speed)):
+        coords, merged, frame_ends, gap = framed_stroke
+        line_width = sources[l].line_widths[s]
+        material_index = sources[l].material_indices[s]
+
+        scene.frame_current += gap
+
+        last = len(frame_ends) - 1
+        for x in range(len(frame_ends)):
+            # The last frame is always keyed, since it may be the one the
+            # layer is left showing
+            if 0 < x < last and repeats_last_point(merged, frame_ends[x - 1], frame_ends[x]):
+                scene.frame_current += 1
+                continue
+
+            frame = layers[l].frames.new(scene.frame_current)
+            for prev_coords, prev_width, prev_material in drawn[l]:
+                emit_stroke(frame, prev_coords, prev_width, material_index=prev_material)
+            # The finished stroke leaves out the cut points, so a later
+            # reanimate reads back the same points
+            if x == last:
+                emit_stroke(frame, coords, line_width, material_index=material_index)
+            else:
+                emit_stroke(frame, merged[:frame_ends[x]], line_width, material_index=material_index)
+
+            scene.frame_current += 1
+
+        drawn[l].append((coords, line_width, material_index))
+
+    # Leave the scene on the last frame, like draw_glyph does
+    scene.frame_current -= 1
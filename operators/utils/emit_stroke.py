@@ -0,0 +1,37 @@
+import numpy as np
+
+
+def emit_stroke(frame, verts, line_width, display_mode='3DSPACE', material_index=0):
+    """
+    Add a stroke to a grease pencil frame in a single bulk write
+
+    The stroke is sized once with points.add and every coordinate is
+    written with one foreach_set call instead of an RNA access per axis.
+
+    Parameters
+    ----------
+    frame: bpy.types.GPencilFrame
+        The frame that receives the new stroke
+    verts: list of vertices or numpy array of shape (n, 3)
+        The x, y and z coordinates of each point of the stroke
+    line_width: int
+        The thickness of the new stroke
+    display_mode: str
+        The display mode of the new stroke
+    material_index: int
+        The material slot of the new stroke
+
+    Returns
+    -------
+    stroke: bpy.types.GPencilStroke
+        The newly created stroke
+    """
+    co = np.asarray(verts, dtype=np.float32).reshape(-1)
+
+    stroke = frame.strokes.new()
+    stroke.line_width = int(line_width)
+    stroke.display_mode = display_mode
+    stroke.material_index = int(material_index)
+    stroke.points.add(len(co) // 3)
+    stroke.points.foreach_set("co", co)
+    return stroke
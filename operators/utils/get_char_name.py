@@ -0,0 +1,194 @@
+def get_char_name(char):
+    character_dict = {
+        "!": "exclamation",
+        "#": "pound",
+        "$": "dollar",
+        "%": "percentage",
+        "&": "ampersand",
+        "'": "quotesingle",
+        "(": "parenthesisleft",
+        ")": "parenthesisright",
+        "*": "asterisk",
+        "+": "plus",
+        ",": "comma",
+        "-": "minus",
+        ".": "period",
+        "/": "slash",
+        "№": "numero-sign",
+        "0": "0",
+        "1": "1",
+        "2": "2",
+        "3": "3",
+        "4": "4",
+        "5": "5",
+        "6": "6",
+        "7": "7",
+        "8": "8",
+        "9": "9",
+        ":": "colon",
+        ";": "semicolon",
+        "<": "lessthan",
+        "=": "equal",
+        ">": "greaterthan",
+        "?": "question",
+        "@": "at",
+        "A": "a-uppercase",
+        "B": "b-uppercase",
+        "C": "c-uppercase",
+        "D": "d-uppercase",
+        "E": "e-uppercase",
+        "F": "f-uppercase",
+        "G": "g-uppercase",
+        "H": "h-uppercase",
+        "I": "i-uppercase",
+        "J": "j-uppercase",
+        "K": "k-uppercase",
+        "L": "l-uppercase",
+        "M": "m-uppercase",
+        "N": "n-uppercase",
+        "O": "o-uppercase",
+        "P": "p-uppercase",
+        "Q": "q-uppercase",
+        "R": "r-uppercase",
+        "S": "s-uppercase",
+        "T": "t-uppercase",
+        "U": "u-uppercase",
+        "V": "v-uppercase",
+        "W": "w-uppercase",
+        "X": "x-uppercase",
+        "Y": "y-uppercase",
+        "Z": "z-uppercase",
+        "[": "bracketleft",
+        "\\": "backslash",
+        "]": "bracketright",
+        "^": "caret",
+        "_": "underscore",
+        "`": "grave",
+        "a": "a-lowercase",
+        "b": "b-lowercase",
+        "c": "c-lowercase",
+        "d": "d-lowercase",
+        "e": "e-lowercase",
+        "f": "f-lowercase",
+        "g": "g-lowercase",
+        "h": "h-lowercase",
+        "i": "i-lowercase",
+        "j": "j-lowercase",
+        "k": "k-lowercase",
+        "l": "l-lowercase",
+        "m": "m-lowercase",
+        "n": "n-lowercase",
+        "o": "o-lowercase",
+        "p": "p-lowercase",
+        "q": "q-lowercase",
+        "r": "r-lowercase",
+        "s": "s-lowercase",
+        "t": "t-lowercase",
+        "u": "u-lowercase",
+        "v": "v-lowercase",
+        "w": "w-lowercase",
+        "x": "x-lowercase",
+        "y": "y-lowercase",
+        "z": "z-lowercase",
+        "{": "curlyleft",
+        "|": "verticalbar",
+        "}": "curlyright",
+        "~": "tilde",
+        "Δ": "delta",
+        "←": "arrowleft",
+        "↑": "arrowup",
+        "→": "arrowright",
+        "↓": "arrowdown",
+        "☐": "box",
+        "♀": "female",
+        "♂": "male",
+        '"': "quotedouble",
+        "°": "degree",
+
+        # Russian Characters
+        "а": "а-lowercase",
+        "А": "а-uppercase",
+        "б": "б-lowercase",
+        "Б": "б-uppercase",
+        "в": "в-lowercase",
+        "В": "в-uppercase",
+        "г": "г-lowercase",
+        "Г": "г-uppercase",
+        "д": "д-lowercase",
+        "Д": "д-uppercase",
+        "е": "е-lowercase",
+        "Е": "е-uppercase",
+        "ё": "ё-lowercase",
+        "Ё": "ё-uppercase",
+        "ж": "ж-lowercase",
+        "Ж": "ж-uppercase",
+        "з": "з-lowercase",
+        "З": "з-uppercase",
+        "и": "и-lowercase",
+        "И": "и-uppercase",
+        "й": "й-lowercase",
+        "Й": "й-uppercase",
+        "к": "к-lowercase",
+        "К": "к-uppercase",
+        "л": "л-lowercase",
+        "Л": "л-uppercase",
+        "м": "м-lowercase",
+        "М": "м-uppercase",
+        "н": "н-lowercase",
+        "Н": "н-uppercase",
+        "о": "о-lowercase",
+        "О": "о-uppercase",
+        "п": "п-lowercase",
+        "П": "п-uppercase",
+        "р": "р-lowercase",
+        "Р": "р-uppercase",
+        "с": "с-lowercase",
+        "С": "с-uppercase",
+        "т": "т-lowercase",
+        "Т": "т-uppercase",
+        "у": "у-lowercase",
+        "У": "у-uppercase",
+        "ф": "ф-lowercase",
+        "Ф": "ф-uppercase",
+        "х": "х-lowercase",
+        "Х": "х-uppercase",
+        "ц": "ц-lowercase",
+        "Ц": "ц-uppercase",
+        "ч": "ч-lowercase",
+        "Ч": "ч-uppercase",
+        "ш": "ш-lowercase",
+        "Ш": "ш-uppercase",
+        "щ": "щ-lowercase",
+        "Щ": "щ-uppercase",
+        "ъ": "ъ-lowercase",
+        "Ъ": "ъ-uppercase",
+        "ы": "ы-lowercase",
+        "Ы": "ы-uppercase",
+        "ь": "ь-lowercase",
+        "Ь": "ь-uppercase",
+        "э": "э-lowercase",
+        "Э": "э-uppercase",
+        "ю": "ю-lowercase",
+        "Ю": "ю-uppercase",
+        "я": "я-lowercase",
+        "Я": "я-uppercase",
+
+        # Tajik Characters
+        "ғ": "ғ-lowercase",
+        "Ғ": "ғ-uppercase",
+        "ӣ": "ӣ-lowercase",
+        "Ӣ": "ӣ-uppercase",
+        "қ": "қ-lowercase",
+        "Қ": "қ-uppercase",
+        "ӯ": "ӯ-lowercase",
+        "Ӯ": "ӯ-uppercase",
+        "ҳ": "ҳ-lowercase",
+        "Ҳ": "ҳ-uppercase",
+        "ҷ": "ҷ-lowercase",
+        "Ҷ": "ҷ-uppercase",
+
+    }
+    try:
+        return character_dict[char]
+    except KeyError:
+        return character_dict['☐']
@@ -0,0 +1,58 @@
+# The custom property that marks the materials made by get_material, and
+# holds the style they were made for
+MATERIAL_TAG = 'gw_material'
+
+
+def same_color(a, b):
+    return all(abs(a[i] - b[i]) < 1e-5 for i in range(3))
+
+
+def get_material(style, color):
+    """
+    Get a grease pencil material of the given style and color, reusing one
+    made by an earlier call instead of creating a duplicate
+
+    Parameters
+    ----------
+    style: str
+        What the material is for, such as 'writings' or 'decorator'; it is
+        also the name of new materials
+    color: sequence of 3 floats
+        The red, green and blue stroke color
+
+    Returns
+    -------
+    material: bpy.types.Material
+    """
+    import bpy
+
+    for mat in bpy.data.materials:
+        if (mat.get(MATERIAL_TAG) == style and
+            mat.grease_pencil is not None and
+            same_color(mat.grease_pencil.color, color)):
+                return mat
+
+    new_mat = bpy.data.materials.new(style)
+    bpy.data.materials.create_gpencil_data(new_mat)
+    new_mat.grease_pencil.color[0] = color[0]
+    new_mat.grease_pencil.color[1] = color[1]
+    new_mat.grease_pencil.color[2] = color[2]
+    new_mat[MATERIAL_TAG] = style
+    return new_mat
+
+
+def purge_materials():
+    """
+    Remove the materials made by get_material that nothing uses anymore
+
+    Returns
+    -------
+    count: int
+        The number of materials removed
+    """
+    import bpy
+
+    orphans = [mat for mat in bpy.data.materials if MATERIAL_TAG in mat and mat.users == 0]
+    for mat in orphans:
+        bpy.data.materials.remove(mat)
+    return len(orphans)
@@ -0,0 +1,256 @@
+import os
+import json
+import numpy as np
+from .get_char_name import get_char_name
+from .parse_glyph import read_glyph_file
+from .simplify_stroke import simplify_stroke
+from .stroke_set import StrokeSet
+
+FONTS_FOLDER = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'fonts')
+
+# Optional precompiled font pack, see build_font_pack
+PACK_NAME = 'glyphs.pack'
+INDEX_NAME = 'glyphs.json'
+
+# Per-glyph metrics, see build_font_metrics
+METRICS_NAME = 'metrics.json'
+
+# Parsed glyphs keyed by (font, char, tolerance), memory-mapped packs and
+# metrics tables keyed by font
+glyph_cache = {}
+font_packs = {}
+font_metrics = {}
+
+
+def get_font_folder(font):
+    return os.path.join(FONTS_FOLDER, font)
+
+
+def get_source_stamp(folder):
+    """
+    Sum up the .glyph files of a font folder as their number, total size
+    and newest modification time, so a pack can tell it is out of date
+    """
+    paths = [os.path.join(folder, file_name) for file_name in os.listdir(folder) if file_name.endswith('.glyph')]
+    if len(paths) == 0:
+        return [0, 0, 0]
+    return [
+        len(paths),
+        sum(os.path.getsize(path) for path in paths),
+        max(os.path.getmtime(path) for path in paths),
+    ]
+
+
+def load_font_pack(font):
+    """
+    Memory-map the precompiled pack of a font, rebuilding it first if its
+    glyph files changed since it was built
+
+    Returns
+    -------
+    pack: tuple or None
+        The (n, 3) float32 coordinate array and the index that maps each
+        glyph name to the [start, stop] rows of its strokes, or None if the
+        font has no pack, or has a stale one that cannot be rebuilt
+    """
+    if font not in font_packs:
+        folder = get_font_folder(font)
+        pack_path = os.path.join(folder, PACK_NAME)
+        index_path = os.path.join(folder, INDEX_NAME)
+
+        index = None
+        if os.path.isfile(pack_path) and os.path.isfile(index_path):
+            with open(index_path) as f:
+                index = json.load(f)
+            if index.get("source") != get_source_stamp(folder):
+                try:
+                    index = build_font_pack(font)
+                except OSError:
+                    # The add-on may be installed read-only; read the glyph
+                    # files instead
+                    index = None
+
+        if index is not None:
+            coords = np.memmap(pack_path, dtype=np.float32, mode='r').reshape(-1, 3)
+            font_packs[font] = (coords, index["glyphs"])
+        else:
+            font_packs[font] = None
+
+    return font_packs[font]
+
+
+def load_glyph(font, char, tolerance=0):
+    """
+    Get the strokes of a character, parsing its glyph at most once
+
+    With a tolerance, the strokes are simplified with simplify_stroke, once
+    per tolerance. The returned StrokeSet is shared by every caller, so its
+    points are read-only; copy it before moving it.
+    """
+    key = (font, char, tolerance)
+    if key in glyph_cache:
+        return glyph_cache[key]
+
+    glyph_name = get_char_name(char)
+    pack = load_font_pack(font)
+    if pack is not None:
+        coords, index = pack
+        if glyph_name not in index:
+            glyph_name = 'box'
+        offsets = index[glyph_name]
+    else:
+        folder = get_font_folder(font)
+        path = os.path.join(folder, glyph_name + '.glyph')
+        if not os.path.isfile(path):
+            path = os.path.join(folder, 'box.glyph')
+        coords, offsets = read_glyph_file(path)
+
+    if tolerance > 0:
+        glyph = StrokeSet.from_strokes(simplify_stroke(coords[start:stop], tolerance) for start, stop in offsets)
+    else:
+        glyph = StrokeSet.from_strokes(coords[start:stop] for start, stop in offsets)
+    glyph.coords.flags.writeable = False
+    glyph_cache[key] = glyph
+    return glyph
+
+
+def clear_glyph_cache(font=None):
+    """
+    Forget the parsed glyphs and packs of a font, or of every font
+    """
+    for key in list(glyph_cache):
+        if font is None or key[0] == font:
+            del glyph_cache[key]
+    for key in list(font_packs):
+        if font is None or key == font:
+            del font_packs[key]
+    for key in list(font_metrics):
+        if font is None or key == font:
+            del font_metrics[key]
+
+
+def build_font_pack(font):
+    """
+    Precompile every .glyph file of a font into a single float32 file plus
+    a JSON index of stroke offsets, so it can be memory-mapped at load
+
+    The index also holds the get_source_stamp of the glyph files, and is
+    returned.
+    """
+    folder = get_font_folder(font)
+
+    chunks = []
+    index = {}
+    row = 0
+    for file_name in sorted(os.listdir(folder)):
+        if not file_name.endswith('.glyph'):
+            continue
+        coords, offsets = read_glyph_file(os.path.join(folder, file_name))
+        chunks.append(coords.astype(np.float32))
+        index[file_name[:-len('.glyph')]] = [[start + row, stop + row] for start, stop in offsets]
+        row += len(coords)
+
+    # Let go of the old pack's memory map before overwriting it
+    clear_glyph_cache(font)
+
+    index = {"source": get_source_stamp(folder), "glyphs": index}
+    np.concatenate(chunks).tofile(os.path.join(folder, PACK_NAME))
+    with open(os.path.join(folder, INDEX_NAME), 'w') as f:
+        json.dump(index, f)
+
+    return index
+
+
+def get_coords_metrics(coords, y_range=None):
+    """
+    Measure a glyph from the coordinates of all of its strokes
+
+    Returns
+    -------
+    metrics: dict
+        The "width" the glyph advances by, its "bbox" as
+        [min_x, max_x, min_y, max_y], and for cursive fonts the "entry" and
+        "exit" x where it connects to its neighbours within y_range, or None
+        if it has no vertex in that range
+    """
+    metrics = {
+        "width": float(coords[:, 0].max()),
+        "bbox": [
+            float(coords[:, 0].min()),
+            float(coords[:, 0].max()),
+            float(coords[:, 1].min()),
+            float(coords[:, 1].max()),
+        ],
+        "entry": None,
+        "exit": None,
+    }
+    if y_range is not None:
+        in_range = (coords[:, 1] >= y_range[0]) & (coords[:, 1] <= y_range[1])
+        if in_range.any():
+            metrics["entry"] = float(coords[in_range, 0].min())
+            metrics["exit"] = float(coords[in_range, 0].max())
+    return metrics
+
+
+def build_font_metrics(font, y_range=None):
+    """
+    Measure every glyph of a font and save the table next to its glyphs
+    """
+    folder = get_font_folder(font)
+
+    glyphs = {}
+    for file_name in sorted(os.listdir(folder)):
+        if not file_name.endswith('.glyph'):
+            continue
+        coords, offsets = read_glyph_file(os.path.join(folder, file_name))
+        glyphs[file_name[:-len('.glyph')]] = get_coords_metrics(coords, y_range)
+
+    table = {"y_range": y_range, "glyphs": glyphs}
+    try:
+        with open(os.path.join(folder, METRICS_NAME), 'w') as f:
+            json.dump(table, f)
+    except OSError:
+        # The add-on may be installed read-only; keep the table in memory
+        pass
+
+    font_metrics[font] = table
+    return table
+
+
+def load_font_metrics(font, y_range=None):
+    """
+    Get the metrics table of a font, building it if it is missing or older
+    than any of the font's glyph files
+    """
+    table = font_metrics.get(font)
+    if table is not None and table["y_range"] == y_range:
+        return table
+
+    folder = get_font_folder(font)
+    path = os.path.join(folder, METRICS_NAME)
+    if os.path.isfile(path):
+        newest = max(
+            os.path.getmtime(os.path.join(folder, file_name))
+            for file_name in os.listdir(folder)
+            if file_name.endswith('.glyph')
+        )
+        if os.path.getmtime(path) >= newest:
+            with open(path) as f:
+                table = json.load(f)
+            if table["y_range"] == y_range:
+                font_metrics[font] = table
+                return table
+
+    return build_font_metrics(font, y_range)
+
+
+def get_glyph_metrics(font, char, y_range=None):
+    """
+    Look up the metrics of a character, falling back on the box glyph like
+    load_glyph does
+    """
+    glyphs = load_font_metrics(font, y_range)["glyphs"]
+    glyph_name = get_char_name(char)
+    if glyph_name not in glyphs:
+        glyph_name = 'box'
+    return glyphs[glyph_name]
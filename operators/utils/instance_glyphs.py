@@ -0,0 +1,140 @@
+import json
+from .emit_stroke import emit_stroke
+from .get_char_name import get_char_name
+from .glyph_cache import load_glyph
+from .draw_glyph import remove_finished_layers, remove_live_layer, clear_glyph_size
+
+# The custom property that marks the grease pencils made by
+# get_glyph_template, and holds the key they were made for
+TEMPLATE_TAG = 'gw_glyph_template'
+
+# The custom property that marks the objects placed by draw_instanced
+INSTANCE_TAG = 'gw_glyph_instance'
+
+
+def get_template_key(font, char, tolerance, thickness, material, frame_number):
+    return json.dumps([font, char, tolerance, thickness, material.name, frame_number])
+
+
+def get_glyph_template(templates, font, char, tolerance, thickness, material, frame_number):
+    """
+    Get the grease pencil that holds a single glyph, reusing one made by an
+    earlier write instead of creating a duplicate
+
+    Parameters
+    ----------
+    templates: dict
+        The templates found so far, by key; new templates are added to it
+    font, char, tolerance:
+        See load_glyph
+    thickness: int
+        The line width of the glyph's strokes
+    material: bpy.types.Material
+        The material of the glyph's strokes
+    frame_number: int
+        The only keyframe of the template; nothing shows before it
+
+    Returns
+    -------
+    template: bpy.types.GreasePencil
+    """
+    import bpy
+
+    key = get_template_key(font, char, tolerance, thickness, material, frame_number)
+    if key in templates:
+        return templates[key]
+
+    template = bpy.data.grease_pencils.new('glyph_' + get_char_name(char))
+    template[TEMPLATE_TAG] = key
+    template.materials.append(material)
+
+    layer = template.layers.new('strokes', set_active=True)
+    frame = layer.frames.new(frame_number)
+    for stroke in load_glyph(font, char, tolerance):
+        emit_stroke(frame, stroke, thickness)
+
+    templates[key] = template
+    return template
+
+
+def remove_glyph_instances(obj):
+    """
+    Remove the objects that draw_instanced placed under obj, along with the
+    templates that no other object uses anymore, so their materials can be
+    purged
+    """
+    import bpy
+
+    templates = {}
+    for child in list(obj.children):
+        if INSTANCE_TAG in child:
+            templates[child.data.name] = child.data
+            bpy.data.objects.remove(child)
+
+    for template in templates.values():
+        if template.users == 0:
+            bpy.data.grease_pencils.remove(template)
+
+
+def draw_instanced(obj, line_glyphs, font, tolerance=0, material=None):
+    """
+    Write a text as one object per character, each linked to a shared
+    template of its glyph, instead of drawing every stroke of every
+    character
+
+    Every distinct glyph is emitted once, so a long text costs one small
+    object per character rather than a copy of its vertices. The objects
+    are children of obj and are placed in its space, so scaling obj scales
+    the whole text, and are linked into the collections of obj. The text is
+    static: it shows from the scene's current frame onward, without the
+    drawing animation.
+
+    Parameters
+    ----------
+    obj: bpy.types.Object
+        The grease pencil object to write under; its own strokes are
+        removed
+    line_glyphs: iterable of lists of dict
+        The glyphs of each line, as from iter_line_glyphs
+    font, tolerance:
+        See load_glyph
+    material: bpy.types.Material
+        The material of the strokes; the first material of obj by default
+    """
+    import bpy
+
+    scene = bpy.context.scene
+    gpencil = obj.data
+    if material is None:
+        material = gpencil.materials[0]
+
+    if len(gpencil.layers) > 0:
+        gpencil.layers[0].clear()
+    remove_finished_layers(gpencil)
+    remove_live_layer(obj)
+    remove_glyph_instances(obj)
+    clear_glyph_size(gpencil)
+
+    templates = {}
+    for data in bpy.data.grease_pencils:
+        if TEMPLATE_TAG in data:
+            templates[data[TEMPLATE_TAG]] = data
+
+    frame_start = scene.frame_current
+    collections = list(obj.users_collection)
+
+    count = 0
+    for glyphs in line_glyphs:
+        for glyph in glyphs:
+            template = get_glyph_template(
+                templates, font, glyph["char"], tolerance, scene.gw_thickness, material, frame_start)
+
+            # Numbered names skip Blender's search for a free name
+            instance = bpy.data.objects.new(obj.name + '.' + str(count).zfill(5), template)
+            instance[INSTANCE_TAG] = True
+            instance.location[0] = glyph["x"]
+            instance.location[1] = glyph["y"]
+            instance.parent = obj
+            for collection in collections:
+                collection.objects.link(instance)
+            count += 1
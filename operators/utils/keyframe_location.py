@@ -0,0 +1,97 @@
+import numpy as np
+
+
+def get_location_fcurve(obj, index):
+    """
+    Get the F-curve animating one axis of an object's location, creating
+    the action and F-curve if they don't exist yet
+    """
+    import bpy
+
+    if obj.animation_data is None:
+        obj.animation_data_create()
+    action = obj.animation_data.action
+    if action is None:
+        action = bpy.data.actions.new(obj.name + "Action")
+        obj.animation_data.action = action
+
+    fcurve = action.fcurves.find("location", index=index)
+    if fcurve is None:
+        fcurve = action.fcurves.new("location", index=index, action_group="Object Transforms")
+    return fcurve
+
+
+def keyframe_location(obj, frames, locations, trace2d=False):
+    """
+    Key an object's location at many frames in one bulk write per axis
+
+    This replaces calling keyframe_insert once per frame and axis. The
+    F-curves are edited in place, so their modifiers, extrapolation and the
+    keys they already have on other frames are kept. Keys on the same
+    frames keep their interpolation and easing and move to the new value
+    along with their handles. When a frame appears more than once, the last
+    location given for it wins, as it would with keyframe_insert.
+
+    Parameters
+    ----------
+    obj: bpy.types.Object
+        The object to animate
+    frames: sequence of numbers
+        The frame of each key
+    locations: numpy array of shape (n, 3)
+        The location of the object at each frame
+    trace2d: bool
+        Only key the x and y axes
+    """
+    frames = np.asarray(frames, dtype=np.float32)
+    locations = np.asarray(locations, dtype=np.float32).reshape(-1, 3)
+    if len(frames) == 0:
+        return
+
+    # Keep the last location of each frame
+    frames, last = np.unique(frames[::-1], return_index=True)
+    locations = locations[::-1][last]
+
+    axes = 2 if trace2d else 3
+    for index in range(axes):
+        fcurve = get_location_fcurve(obj, index)
+        keyframe_points = fcurve.keyframe_points
+        values = locations[:, index]
+
+        count = len(keyframe_points)
+        co = np.empty(count * 2, dtype=np.float32)
+        keyframe_points.foreach_get("co", co)
+        co = co.reshape(-1, 2)
+        handle_left = np.empty(count * 2, dtype=np.float32)
+        keyframe_points.foreach_get("handle_left", handle_left)
+        handle_left = handle_left.reshape(-1, 2)
+        handle_right = np.empty(count * 2, dtype=np.float32)
+        keyframe_points.foreach_get("handle_right", handle_right)
+        handle_right = handle_right.reshape(-1, 2)
+
+        # Find the keys already on the given frames, and move them and their
+        # handles to the new values, keeping everything else about them
+        order = np.argsort(co[:, 0], kind='stable')
+        rows = np.minimum(np.searchsorted(co[order, 0], frames), max(count - 1, 0))
+        matched = np.zeros(len(frames), dtype=bool)
+        if count > 0:
+            rows = order[rows]
+            matched = co[rows, 0] == frames
+        rows = rows[matched]
+        delta = values[matched] - co[rows, 1]
+        co[rows, 1] += delta
+        handle_left[rows, 1] += delta
+        handle_right[rows, 1] += delta
+
+        # The other frames get new keys, added at the end; update() sorts
+        # them in and works out their handles
+        added = np.column_stack((frames[~matched], values[~matched]))
+        keyframe_points.add(len(added))
+        co = np.concatenate((co, added))
+        handle_left = np.concatenate((handle_left, added))
+        handle_right = np.concatenate((handle_right, added))
+
+        keyframe_points.foreach_set("co", co.reshape(-1))
+        keyframe_points.foreach_set("handle_left", handle_left.reshape(-1))
+        keyframe_points.foreach_set("handle_right", handle_right.reshape(-1))
+        fcurve.update()
@@ -0,0 +1,183 @@
+from .glyph_cache import load_glyph, get_glyph_metrics
+from .stroke_set import StrokeSet
+
+# Adjust settings for each font so they look good by default
+font_props = {
+    "consolas": {
+        "word space": 0.425,
+        "kerning": 0.425,
+        "line height": 1.1,
+        #"monospace": True
+    },
+    "hershey_script_simplex": {
+        "word space": 0.5,
+        "kerning": 0.26,
+        "line height": 2.2,
+        # The cursive letters should connect somewhere within this y range
+        "y_range": [0.63, 1.4],
+    },
+    "hershey_roman_simplex": {
+        "word space": 0.5,
+        "kerning": 0.185,
+        "line height": 1.25,
+    },
+    "shohrukh_russian": {
+        "word space": 0.4,
+        "kerning": 0.2,
+        "line height": 1.1,
+    },
+    "shohrukh_tajik": {
+        "word space": 0.4,
+        "kerning": 0.2,
+        "line height": 1.1,
+    },
+}
+
+
+def iter_line_glyphs(lines, font, kerning=1.0, word_space=1.0, line_height=1.0, tolerance=0):
+    """
+    Place the glyphs of a text one line at a time, without building any
+    strokes
+
+    Parameters
+    ----------
+    lines: iterable of str
+        The lines of the text, without their newlines
+    font, kerning, word_space, line_height, tolerance:
+        See layout_text
+
+    Yields
+    ------
+    glyphs:
+        The glyph metadata of each line, as from layout_text, except that
+        the "strokes" ranges count from the line's first stroke
+    """
+    props = font_props[font]
+    kerning = props['kerning'] * kerning
+    word_space = props['word space'] * word_space
+    line_height = props['line height'] * line_height
+    y_range = props.get('y_range')
+
+    current_y = 0
+
+    for line_number, text in enumerate(lines):
+        if line_number > 0:
+            current_y -= line_height
+        current_x = 0
+
+        stroke_count = 0
+        glyphs = []
+
+        c = 0
+        while c < len(text):
+            char = text[c]
+            if char == " ":
+                current_x += word_space
+            else:
+                glyph = load_glyph(font, char, tolerance)
+                metrics = get_glyph_metrics(font, char, y_range)
+                glyph_width = metrics['width']
+
+                offset_x = current_x
+                if 'monospace' in props:
+                    offset_x += (kerning / 2) - (glyph_width / 2)
+                offset_y = current_y - line_height
+
+                start = stroke_count
+                stroke_count += len(glyph)
+
+                glyphs.append({
+                    "char": char,
+                    "x": offset_x,
+                    "y": offset_y,
+                    "width": glyph_width,
+                    "strokes": (start, stroke_count),
+                })
+
+                if char.isalpha() and y_range is not None and c < len(text) - 1 and text[c + 1].isalpha():
+                    next_metrics = get_glyph_metrics(font, text[c + 1], y_range)
+                    current_x += metrics['exit'] - next_metrics['entry']
+
+                elif 'monospace' in props:
+                    current_x += kerning
+
+                else:
+                    current_x += glyph_width + kerning
+            c += 1
+
+        yield glyphs
+
+
+def iter_layout(lines, font, kerning=1.0, word_space=1.0, line_height=1.0, tolerance=0):
+    """
+    Lay out a text one line at a time, so only a single line is ever held
+    in memory
+
+    The cached glyphs are never copied or moved one by one; each line is
+    built at once with StrokeSet.place.
+
+    Parameters
+    ----------
+    lines: iterable of str
+        The lines of the text, without their newlines
+    font, kerning, word_space, line_height, tolerance:
+        See layout_text
+
+    Yields
+    ------
+    glyph_strokes, glyphs:
+        The strokes and glyph metadata of each line, as from layout_text,
+        except that the "strokes" ranges count from the line's first stroke
+    """
+    for glyphs in iter_line_glyphs(lines, font, kerning, word_space, line_height, tolerance):
+        templates = [load_glyph(font, glyph["char"], tolerance) for glyph in glyphs]
+        offsets = [(glyph["x"], glyph["y"], 0) for glyph in glyphs]
+        yield StrokeSet.place(templates, offsets), glyphs
+
+
+def iter_glyph_strokes(lines, font, kerning=1.0, word_space=1.0, line_height=1.0, tolerance=0):
+    """
+    Yield every stroke of a text in drawing order, laying it out lazily
+    """
+    for glyph_strokes, glyphs in iter_layout(lines, font, kerning, word_space, line_height, tolerance):
+        for stroke in glyph_strokes:
+            yield stroke
+
+
+def layout_text(text, font, kerning=1.0, word_space=1.0, line_height=1.0, tolerance=0):
+    """
+    Place the glyphs of a text, without needing Blender
+
+    Parameters
+    ----------
+    text: str
+        The text to write; newlines start a new line
+    font: str
+        The name of a folder in operators/fonts
+    kerning, word_space, line_height: float
+        Multipliers for the font's default spacing, like the scene settings
+    tolerance: float
+        When above 0, drop the glyph vertices that are closer than this to
+        the simplified strokes, in glyph units; see simplify_stroke
+
+    Returns
+    -------
+    glyph_strokes: StrokeSet
+        Every stroke of the text in the order it is drawn
+    glyphs: list of dict
+        For each written character: its "char", the "x" and "y" offset it
+        was placed at, its "width", and the [start, stop) range of
+        glyph_strokes that belong to it under "strokes"
+    """
+    lines = []
+    stroke_count = 0
+    glyphs = []
+    for line_strokes, line_glyphs in iter_layout(text.split('\n'), font, kerning, word_space, line_height, tolerance):
+        for glyph in line_glyphs:
+            start, stop = glyph["strokes"]
+            glyph["strokes"] = (start + stroke_count, stop + stroke_count)
+        lines.append(line_strokes)
+        stroke_count += len(line_strokes)
+        glyphs.extend(line_glyphs)
+
+    return StrokeSet.concatenate(lines), glyphs
@@ -0,0 +1,231 @@
+import uuid
+import itertools
+import numpy as np
+from .resample_stroke import iter_framed_strokes
+from .emit_stroke import emit_stroke
+from .draw_glyph import LIVE_LAYER, remove_finished_layers, clear_glyph_size
+from .read_frame import read_frame
+
+# Schedules of live objects keyed by object name, along with the key they
+# were built for, see get_live_schedule
+live_schedules = {}
+
+
+def build_live_schedule(glyph_strokes, speed, frame_start):
+    """
+    Work out when each stroke is drawn, following the same schedule as
+    draw_glyph
+
+    Returns
+    -------
+    schedule: dict
+        "starts", the frame each stroke starts being drawn on; "merged" and
+        "frame_ends", the cut strokes as from iter_framed_strokes; and
+        "frame_end", the frame the drawing is finished on
+    """
+    starts = []
+    merged_strokes = []
+    frame_ends_list = []
+
+    frame_current = frame_start + 1
+    for coords, merged, frame_ends, gap in iter_framed_strokes(glyph_strokes, speed):
+        frame_current += gap
+        starts.append(frame_current)
+        merged_strokes.append(merged.astype(np.float32))
+        frame_ends_list.append(frame_ends)
+        frame_current += len(frame_ends)
+
+    return {
+        "starts": np.array(starts, dtype=int),
+        "merged": merged_strokes,
+        "frame_ends": frame_ends_list,
+        "frame_end": max(frame_current - 1, frame_start),
+    }
+
+
+def get_live_state(schedule, frame_number):
+    """
+    Find what a live drawing shows on a frame
+
+    Returns
+    -------
+    complete: int
+        The number of strokes that are fully drawn
+    partial: numpy array or None
+        The part drawn so far of the stroke after them, if any
+    """
+    i = np.searchsorted(schedule["starts"], frame_number, side='right') - 1
+    if i < 0:
+        return 0, None
+
+    frame_ends = schedule["frame_ends"][i]
+    x = frame_number - schedule["starts"][i]
+    if x >= len(frame_ends) - 1:
+        return int(i) + 1, None
+    return int(i), schedule["merged"][i][:frame_ends[x]]
+
+
+def renew_live_schedule(obj):
+    """
+    Give a live object a new stamp, so its next update rebuilds the schedule
+    and redraws the live layer from scratch; needed whenever the strokes of
+    its first layer are rewritten
+    """
+    obj['gw_live']['stamp'] = uuid.uuid4().hex
+
+
+def get_live_schedule(obj):
+    """
+    Get the schedule of a live object, rebuilding it when its stamp,
+    settings or number of points change
+    """
+    settings = obj['gw_live']
+    frame = obj.data.layers[0].frames[-1]
+    key = (
+        settings.get('stamp'),
+        settings['frame_start'],
+        settings['speed'],
+        tuple(len(stroke.points) for stroke in frame.strokes),
+    )
+
+    cached = live_schedules.get(obj.name)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    strokes = read_frame(frame)
+    schedule = build_live_schedule(strokes, settings['speed'] / 10, settings['frame_start'])
+    schedule["strokes"] = strokes
+    schedule["shown"] = False
+    live_schedules[obj.name] = (key, schedule)
+    return schedule
+
+
+def update_live_object(obj, frame_number):
+    """
+    Make the live layer of obj show the drawing as it is on frame_number
+
+    Strokes that stay complete are kept from the last update, so moving
+    one frame forward only rewrites the stroke being drawn. The live layer
+    is redrawn from scratch the first time a new schedule is shown.
+    """
+    schedule = get_live_schedule(obj)
+    complete, partial = get_live_state(schedule, frame_number)
+
+    live_layer = obj.data.layers.get(LIVE_LAYER)
+    settings = obj['gw_live']
+
+    if not schedule["shown"]:
+        live_layer.clear()
+        live_layer.frames.new(settings['frame_start'])
+        settings['partial'] = False
+        schedule["shown"] = True
+
+    live_frame = live_layer.frames[0]
+    strokes = live_frame.strokes
+
+    shown = len(strokes)
+    if settings['partial']:
+        strokes.remove(strokes[-1])
+        shown -= 1
+
+    while shown > complete:
+        strokes.remove(strokes[-1])
+        shown -= 1
+
+    drawing = schedule["strokes"]
+    drawing[shown:complete].emit(live_frame)
+
+    settings['partial'] = partial is not None
+    if partial is not None:
+        emit_stroke(live_frame, partial, drawing.line_widths[complete],
+                    material_index=drawing.material_indices[complete])
+
+
+def update_live_objects(scene):
+    """
+    Update every live object of a scene for its current frame; meant to run
+    from a frame_change_pre handler
+    """
+    for obj in scene.objects:
+        if 'gw_live' in obj and obj.type == 'GPENCIL':
+            update_live_object(obj, scene.frame_current)
+
+
+def draw_live(obj, glyph_strokes, thicknesses=None, material_indices=None, speed=None):
+    """
+    Store only the finished strokes of obj and let update_live_objects draw
+    the animation as the frame changes, instead of baking every frame
+
+    The strokes are kept on a hidden first layer, so the other operators see
+    the whole drawing on its last frame as usual, and the animation is shown
+    on a layer of its own with a single keyframe. See bake_live for turning
+    it into ordinary frames.
+
+    The drawing follows speed, in the units of scene.gw_speed, which it
+    defaults to.
+    """
+    import bpy
+
+    scene = bpy.context.scene
+    gpencil = obj.data
+
+    if speed is None:
+        speed = scene.gw_speed
+
+    if thicknesses is None:
+        thicknesses = itertools.repeat(scene.gw_thickness)
+    if material_indices is None:
+        material_indices = itertools.repeat(0)
+
+    if len(gpencil.layers) > 0:
+        layer = gpencil.layers[0]
+    else:
+        layer = gpencil.layers.new('strokes', set_active=True)
+    layer.clear()
+    remove_finished_layers(gpencil)
+    clear_glyph_size(gpencil)
+
+    frame_start = scene.frame_current
+    frame = layer.frames.new(frame_start)
+    for stroke, line_width, material_index in zip(glyph_strokes, thicknesses, material_indices):
+        emit_stroke(frame, stroke, line_width, material_index=material_index)
+    layer.hide = True
+
+    live_layer = gpencil.layers.get(LIVE_LAYER)
+    if live_layer is None:
+        live_layer = gpencil.layers.new(LIVE_LAYER, set_active=False)
+    live_layer.clear()
+    live_layer.frames.new(frame_start)
+
+    obj['gw_live'] = {
+        "frame_start": frame_start,
+        "speed": speed,
+        "partial": False,
+        "stamp": uuid.uuid4().hex,
+    }
+
+    # Leave the scene on the last frame, like draw_glyph does
+    scene.frame_current = get_live_schedule(obj)["frame_end"]
+    update_live_object(obj, scene.frame_current)
+
+
+def bake_live(obj):
+    """
+    Replace the live animation of obj with ordinary frames from draw_glyph
+    """
+    import bpy
+    from .draw_glyph import draw_glyph
+
+    scene = bpy.context.scene
+    settings = obj['gw_live']
+    strokes = read_frame(obj.data.layers[0].frames[-1])
+
+    speed = scene.gw_speed
+    scene.gw_speed = settings['speed']
+    scene.frame_current = settings['frame_start']
+    try:
+        draw_glyph(obj, strokes, thicknesses=strokes.line_widths, material_indices=strokes.material_indices)
+    finally:
+        scene.gw_speed = speed
+
+    live_schedules.pop(obj.name, None)
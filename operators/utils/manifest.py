@@ -0,0 +1,94 @@
+import os
+import csv
+import json
+
+# The columns of a manifest and the type of each; only text is required
+MANIFEST_FIELDS = {
+    "text": str,
+    "name": str,
+    "font": str,
+    "scale": float,
+    "speed": float,
+    "color": float,
+    "start_frame": int,
+    "position": float,
+}
+
+# The number of values the vector fields hold
+VECTOR_SIZES = {
+    "color": 3,
+    "position": 3,
+}
+
+
+def parse_manifest_item(item, number):
+    """
+    Check and convert one entry of a manifest
+
+    Vector fields may be lists, as in JSON, or strings of numbers separated
+    by spaces, as in CSV. Empty fields are left out so the defaults apply.
+    """
+    if not item.get("text"):
+        raise ValueError("Manifest item " + str(number) + " has no text")
+
+    parsed = {}
+    for key, value in item.items():
+        if key not in MANIFEST_FIELDS:
+            raise ValueError("Unknown field '" + str(key) + "' in manifest item " + str(number))
+        if value is None or value == '':
+            continue
+
+        cast = MANIFEST_FIELDS[key]
+        try:
+            if key in VECTOR_SIZES:
+                if isinstance(value, str):
+                    value = value.split()
+                value = tuple(cast(v) for v in value)
+                if len(value) != VECTOR_SIZES[key]:
+                    raise ValueError
+            else:
+                value = cast(value)
+        except (TypeError, ValueError):
+            raise ValueError("Bad " + key + " '" + str(item[key]) + "' in manifest item " + str(number))
+
+        parsed[key] = value
+
+    return parsed
+
+
+def read_manifest(path):
+    """
+    Read the texts to write from a CSV or JSON manifest
+
+    A CSV manifest has a header row naming its columns. A JSON manifest is a
+    list of objects. Either way, each item has a "text" and optionally a
+    "name", "font", "scale", "speed", "color" (r g b from 0 to 1),
+    "start_frame" and "position" (x y z).
+
+    Parameters
+    ----------
+    path: str
+        A file ending in .csv or .json
+
+    Returns
+    -------
+    items: list of dict
+        The fields given for each item, converted to numbers and tuples
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        with open(path, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        # The CSV reader can't hold a newline without quoting, so allow \n
+        for row in rows:
+            if row.get("text"):
+                row["text"] = row["text"].replace('\\n', '\n')
+    elif extension == '.json':
+        with open(path, encoding='utf-8') as f:
+            rows = json.load(f)
+        if not isinstance(rows, list):
+            raise ValueError("A JSON manifest must hold a list of items")
+    else:
+        raise ValueError("Manifest must be a .csv or .json file")
+
+    return [parse_manifest_item(row, i + 1) for i, row in enumerate(rows)]
@@ -0,0 +1,56 @@
+import re
+import numpy as np
+
+NUMBER = r'\s*-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?\s*'
+VERTEX = r'\s*\[' + NUMBER + ',' + NUMBER + ',' + NUMBER + r'\]\s*'
+STROKE_PATTERN = re.compile(r'\s*\[' + VERTEX + '(?:,' + VERTEX + r')*\]\s*')
+BRACKETS = str.maketrans('[]', '  ')
+
+
+def parse_glyph(lines):
+    """
+    Parse the lines of a .glyph file without evaluating them as Python
+
+    Each non-blank line must be one stroke written as a list of [x, y, z]
+    vertices, ie: [[0.0, 0.5, 0], [0.25, 0.75, 0]]
+
+    Parameters
+    ----------
+    lines: iterable of str
+        The lines of the glyph, such as an open file
+
+    Returns
+    -------
+    coords: numpy array of shape (n, 3)
+        The vertices of every stroke, one after another
+    offsets: list of (int, int)
+        The [start, stop) rows of coords that belong to each stroke
+    """
+    chunks = []
+    offsets = []
+    row = 0
+    for line_number, line in enumerate(lines, 1):
+        if line.strip() == '':
+            continue
+        if not STROKE_PATTERN.fullmatch(line):
+            raise ValueError("Malformed stroke on line " + str(line_number) + " of glyph")
+
+        values = np.array(line.translate(BRACKETS).split(','), dtype=np.float64)
+        count = len(values) // 3
+        chunks.append(values)
+        offsets.append((row, row + count))
+        row += count
+
+    if len(chunks) == 0:
+        raise ValueError("Glyph has no strokes")
+
+    coords = np.concatenate(chunks).reshape(-1, 3)
+    return coords, offsets
+
+
+def read_glyph_file(path):
+    """
+    Parse a .glyph file into a coordinate array and per-stroke offsets
+    """
+    with open(path) as f:
+        return parse_glyph(f)
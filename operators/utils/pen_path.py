@@ -0,0 +1,56 @@
+import numpy as np
+from .resample_stroke import iter_framed_strokes
+
+
+def get_pen_path(glyph_strokes, speed, frame_start):
+    """
+    Find where the pen is on every frame of a draw_glyph animation,
+    straight from the strokes, without needing the frames to be baked
+
+    The frames follow the same arc-length schedule as draw_glyph: the empty
+    frame at frame_start, a frame for every cut of every stroke, the gaps
+    the pen travels between strokes, and the final frame with every stroke.
+
+    Parameters
+    ----------
+    glyph_strokes: iterable of numpy arrays of shape (n, 3)
+        The strokes in the order they are drawn
+    speed: float that is > 0.0
+        The distance a stroke lengthens with each frame
+    frame_start: int
+        The frame number the animation starts on
+
+    Returns
+    -------
+    frames: numpy array of int
+        The number of each frame that shows a stroke
+    positions: numpy array of shape (len(frames), 3)
+        The last point drawn on each of those frames
+    """
+    frames = []
+    positions = []
+
+    frame_current = frame_start + 1
+    last_point = None
+    for coords, merged, frame_ends, gap in iter_framed_strokes(glyph_strokes, speed):
+        if last_point is not None:
+            # Every frame of the previous stroke but its last was added; that
+            # one only shows up if another stroke follows
+            frames.append(frame_current)
+            positions.append(last_point)
+            frame_current += 1
+
+        frame_current += gap
+
+        ends = np.asarray(frame_ends[:-1], dtype=int) - 1
+        frames.extend(range(frame_current, frame_current + len(ends)))
+        positions.extend(merged[ends])
+        frame_current += len(ends)
+
+        last_point = merged[-1]
+
+    if last_point is not None:
+        frames.append(frame_current)
+        positions.append(last_point)
+
+    return np.array(frames, dtype=int), np.array(positions, dtype=np.float64).reshape(-1, 3)
@@ -1,6 +1,5 @@
-import math
-import copy
-from .distance_formula import distance_formula
+import numpy as np
+from .resample_stroke import resample_stroke, insert_tips
 
 def process_stroke_verts_linearly(original_stroke_verts, speed, remaining=0, stipple=False):
     """
@@ -13,6 +12,9 @@ def process_stroke_verts_linearly(original_stroke_verts, speed, remaining=0, sti
 
     This algorithm also works for stippling
 
+    The cuts are found by resample_stroke; this only copies them out into
+    lists for callers that need one list of vertices per frame.
+
     Parameters
     ----------
     stroke_verts: list of vertices (integer pairs of x and y)
@@ -22,39 +24,17 @@ def process_stroke_verts_linearly(original_stroke_verts, speed, remaining=0, sti
     -------
     framed_strokes: list of lists of vertices (x & y coordinate pairs)
     """
-    stroke_verts = copy.deepcopy(original_stroke_verts)
-    framed_strokes = [[stroke_verts[0]]]
-
-    remaining = speed + remaining
-    i = 1
-    while i < len(stroke_verts):
-        v1 = stroke_verts[i - 1]
-        v2 = stroke_verts[i]
-        distance = distance_formula(v1, v2)
-
-        x = v2[0] - v1[0]
-        y = v2[1] - v1[1]
-        z = v2[2] - v1[2]
-
-        if distance > remaining:
-            new_x = ((remaining / distance) * x) + v1[0]
-            new_y = ((remaining / distance) * y) + v1[1]
-            new_z = ((remaining / distance) * z) + v1[2]
-
-            framed_strokes[-1].append([new_x, new_y, new_z])
-            if stipple == False:
-                framed_strokes.append(copy.deepcopy(framed_strokes[-1]))
-            else:
-                framed_strokes.append([[new_x, new_y, new_z]])
-
-            stroke_verts[i - 1] = [new_x, new_y, new_z]
-            remaining = speed
-
-        else:
-            framed_strokes[-1].append(v2)
-            remaining -= distance
-            i += 1
+    coords = np.asarray(original_stroke_verts, dtype=np.float64).reshape(-1, 3)
+    end_indices, tips, remaining = resample_stroke(coords, speed, remaining=remaining)
+    merged, tip_indices = insert_tips(coords, end_indices, tips)
+    merged = merged.tolist()
+
+    framed_strokes = []
+    start = 0
+    for tip_index in tip_indices:
+        framed_strokes.append(merged[start:tip_index + 1])
+        if stipple:
+            start = tip_index
+    framed_strokes.append(merged[start:])
 
     return framed_strokes, remaining
-
-
@@ -0,0 +1,37 @@
+import numpy as np
+from .stroke_set import StrokeSet
+
+
+def read_frame(frame):
+    """
+    Read every stroke of a grease pencil frame into flat arrays
+
+    The points of each stroke are copied with a single foreach_get straight
+    into their place in one shared buffer, and the line widths and materials
+    of all the strokes with one more each.
+
+    Parameters
+    ----------
+    frame: bpy.types.GPencilFrame
+
+    Returns
+    -------
+    strokes: StrokeSet
+        The points, line widths and material slots of every stroke
+    """
+    strokes = frame.strokes
+
+    offsets = np.zeros(len(strokes) + 1, dtype=np.int32)
+    np.cumsum([len(stroke.points) for stroke in strokes], out=offsets[1:])
+
+    buffer = np.empty(offsets[-1] * 3, dtype=np.float32)
+    for i, stroke in enumerate(strokes):
+        stroke.points.foreach_get("co", buffer[offsets[i] * 3:offsets[i + 1] * 3])
+
+    line_widths = np.empty(len(strokes), dtype=np.int32)
+    strokes.foreach_get("line_width", line_widths)
+
+    material_indices = np.empty(len(strokes), dtype=np.int32)
+    strokes.foreach_get("material_index", material_indices)
+
+    return StrokeSet(buffer.reshape(-1, 3), offsets, line_widths, material_indices)
@@ -0,0 +1,150 @@
+import numpy as np
+
+
+def get_arc_lengths(coords):
+    """
+    Get the distance travelled along a stroke at each of its vertices
+
+    Parameters
+    ----------
+    coords: numpy array of shape (n, 3)
+
+    Returns
+    -------
+    lengths: numpy array of shape (n,)
+        The cumulative arc length, starting at 0 for the first vertex
+    """
+    lengths = np.zeros(len(coords))
+    if len(coords) > 1:
+        segments = np.sqrt(np.square(np.diff(coords, axis=0)).sum(axis=1))
+        np.cumsum(segments, out=lengths[1:])
+    return lengths
+
+
+def count_cuts(total, first, speed):
+    """
+    Count the cuts first + speed * k that fall before total
+    """
+    count = 0
+    if total > first:
+        count = int(np.ceil((total - first) / speed))
+        while first + count * speed < total:
+            count += 1
+        while count > 0 and first + (count - 1) * speed >= total:
+            count -= 1
+    return count
+
+
+def resample_stroke(coords, speed, remaining=0):
+    """
+    Find where a stroke is cut at the end of each frame of animation
+
+    The first cut lies speed + remaining along the stroke and every other
+    cut lies speed after the one before it. Cut k falls between
+    coords[end_indices[k] - 1] and coords[end_indices[k]], at tips[k]. See
+    insert_tips for the vertices that each frame shows.
+
+    Parameters
+    ----------
+    coords: numpy array of shape (n, 3)
+        The vertices of the stroke
+    speed: float that is > 0.0
+        The distance the stroke lengthens with each frame
+    remaining: float
+        The distance left over from the end of the previous stroke
+
+    Returns
+    -------
+    end_indices: numpy array of int
+        The number of original vertices drawn before each cut
+    tips: numpy array of shape (len(end_indices), 3)
+        The interpolated point at each cut
+    remaining: float
+        The distance left over for the next stroke
+    """
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 3)
+    lengths = get_arc_lengths(coords)
+    total = lengths[-1]
+    first = speed + remaining
+    count = count_cuts(total, first, speed)
+
+    cuts = first + speed * np.arange(count)
+    end_indices = np.searchsorted(lengths, cuts, side='right')
+
+    starts = coords[end_indices - 1]
+    ends = coords[end_indices]
+    fractions = (cuts - lengths[end_indices - 1]) / (lengths[end_indices] - lengths[end_indices - 1])
+    tips = starts + fractions[:, np.newaxis] * (ends - starts)
+
+    remaining = first + count * speed - total
+    return end_indices, tips, remaining
+
+
+def get_travel_frames(start, end, speed):
+    """
+    Count the frames the pen takes to travel between two points
+
+    This is the number of cuts resample_stroke would make on the straight
+    line from start to end, found without resampling it.
+
+    Parameters
+    ----------
+    start, end: sequence of 3 floats
+    speed: float that is > 0.0
+
+    Returns
+    -------
+    frames: int
+    """
+    distance = np.sqrt(np.square(np.subtract(end, start, dtype=np.float64)).sum())
+    return count_cuts(distance, speed, speed)
+
+
+def insert_tips(coords, end_indices, tips):
+    """
+    Merge the cut points into the stroke in the order they are drawn
+
+    Returns
+    -------
+    merged: numpy array of shape (n + len(tips), 3)
+        The vertices and cut points of the stroke
+    tip_indices: numpy array of int
+        The row of merged holding each cut point. Frame k of the animation
+        shows merged[:tip_indices[k] + 1] and the final frame shows merged
+    """
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 3)
+    merged = np.insert(coords, end_indices, tips, axis=0)
+    tip_indices = end_indices + np.arange(len(end_indices))
+    return merged, tip_indices
+
+
+def iter_framed_strokes(glyph_strokes, speed):
+    """
+    Resample a sequence of strokes lazily, carrying the left over distance
+    from each stroke into the next
+
+    Yields
+    ------
+    coords: numpy array of shape (n, 3)
+        The vertices of the stroke
+    merged: numpy array
+        The vertices and cut points, as from insert_tips
+    frame_ends: list of int
+        Frame k of the stroke shows merged[:frame_ends[k]]
+    gap: int
+        The frames the pen travels from the end of the previous stroke
+    """
+    remaining = 0
+    last_vert = None
+    for stroke in glyph_strokes:
+        coords = np.asarray(stroke, dtype=np.float64).reshape(-1, 3)
+        end_indices, tips, remaining = resample_stroke(coords, speed, remaining=remaining)
+        merged, tip_indices = insert_tips(coords, end_indices, tips)
+        frame_ends = list(tip_indices + 1) + [len(merged)]
+
+        gap = 0
+        if last_vert is not None:
+            gap = get_travel_frames(last_vert, coords[0], speed)
+        last_vert = coords[-1]
+
+        yield coords, merged, frame_ends, gap
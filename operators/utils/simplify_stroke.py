@@ -0,0 +1,55 @@
+import numpy as np
+
+
+def get_segment_distances(points, start, end):
+    """
+    Get the distance from each point to the line segment from start to end
+    """
+    direction = end - start
+    length_squared = direction.dot(direction)
+    if length_squared == 0:
+        return np.sqrt(np.square(points - start).sum(axis=1))
+    t = np.clip((points - start).dot(direction) / length_squared, 0, 1)
+    nearest = start + t[:, np.newaxis] * direction
+    return np.sqrt(np.square(points - nearest).sum(axis=1))
+
+
+def simplify_stroke(coords, tolerance):
+    """
+    Drop the vertices of a stroke that lie within tolerance of the line
+    through the ones kept around them (Ramer-Douglas-Peucker)
+
+    The first and last vertex are always kept.
+
+    Parameters
+    ----------
+    coords: numpy array of shape (n, 3)
+    tolerance: float
+        The furthest a dropped vertex may be from the simplified stroke
+
+    Returns
+    -------
+    coords: numpy array of shape (m, 3)
+        The vertices that are kept, in order
+    """
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 3)
+    if tolerance <= 0 or len(coords) < 3:
+        return coords
+
+    keep = np.zeros(len(coords), dtype=bool)
+    keep[0] = keep[-1] = True
+
+    ranges = [(0, len(coords) - 1)]
+    while ranges:
+        first, last = ranges.pop()
+        if last - first < 2:
+            continue
+        distances = get_segment_distances(coords[first + 1:last], coords[first], coords[last])
+        farthest = int(distances.argmax())
+        if distances[farthest] > tolerance:
+            split = first + 1 + farthest
+            keep[split] = True
+            ranges.append((first, split))
+            ranges.append((split, last))
+
+    return coords[keep]
@@ -0,0 +1,99 @@
+import numpy as np
+from .resample_stroke import count_cuts
+from .stroke_set import StrokeSet
+
+
+def stipple_strokes(strokes, stipple_length, skip):
+    """
+    Cut every stroke of a frame into dashes of stipple_length and keep one
+    dash in every skip, all at once
+
+    The cuts follow the same arc-length schedule as resample_stroke, with
+    the distance left over at the end of each stroke carried into the next,
+    and the dashes are counted across strokes, so the pattern continues
+    from one stroke to the next instead of restarting.
+
+    Parameters
+    ----------
+    strokes: StrokeSet
+        The strokes of the frame
+    stipple_length: float that is > 0.0
+        The arc length of every dash, and of every gap between two dashes
+    skip: int that is >= 1
+        Keep every skip-th dash, starting with the first one
+
+    Returns
+    -------
+    dashes: StrokeSet
+        Every kept dash, with the line width and material of the stroke it
+        was cut from
+    """
+    coords = strokes.coords.astype(np.float64)
+    offsets = strokes.offsets.astype(int)
+    stroke_count = len(offsets) - 1
+    firsts = offsets[:-1]
+    lasts = offsets[1:] - 1
+
+    # Arc length over the whole frame from one cumulative sum, with a jump
+    # between strokes so it keeps increasing from one stroke to the next
+    segments = np.zeros(len(coords))
+    segments[1:] = np.sqrt(np.square(np.diff(coords, axis=0)).sum(axis=1))
+    segments[firsts] = 1
+    lengths = np.cumsum(segments)
+    bases = lengths[firsts]
+    totals = lengths[lasts] - bases
+
+    # The only part that depends on the stroke before
+    counts = np.zeros(stroke_count, dtype=int)
+    cut_firsts = np.zeros(stroke_count)
+    remaining = 0
+    for i in range(stroke_count):
+        cut_firsts[i] = stipple_length + remaining
+        counts[i] = count_cuts(totals[i], cut_firsts[i], stipple_length)
+        remaining = cut_firsts[i] + counts[i] * stipple_length - totals[i]
+
+    cut_strokes = np.repeat(np.arange(stroke_count), counts)
+    cut_numbers = np.arange(len(cut_strokes)) - np.repeat(np.cumsum(counts) - counts, counts)
+    cuts = cut_firsts[cut_strokes] + stipple_length * cut_numbers
+
+    # Find the segment of every cut at once; the clip guards against
+    # rounding pushing a cut onto the jump to the next stroke
+    cut_lengths = cuts + bases[cut_strokes]
+    end_indices = np.searchsorted(lengths, cut_lengths, side='right')
+    end_indices = np.clip(end_indices, firsts[cut_strokes] + 1, lasts[cut_strokes])
+
+    starts_at = coords[end_indices - 1]
+    ends_at = coords[end_indices]
+    fractions = (cut_lengths - lengths[end_indices - 1]) / (lengths[end_indices] - lengths[end_indices - 1])
+    tips = starts_at + fractions[:, np.newaxis] * (ends_at - starts_at)
+
+    merged = np.insert(coords, end_indices, tips, axis=0)
+    tip_rows = end_indices + np.arange(len(end_indices))
+
+    # Every stroke starts a dash and every cut both ends one and starts the
+    # next, so the dashes are the sorted starts paired with the sorted stops
+    tips_before = np.concatenate(([0], np.cumsum(counts)))
+    stroke_starts = firsts + tips_before[:-1]
+    stroke_stops = offsets[1:] + tips_before[1:]
+    starts = np.sort(np.concatenate((stroke_starts, tip_rows)))
+    stops = np.sort(np.concatenate((stroke_stops, tip_rows + 1)))
+    dash_strokes = np.searchsorted(stroke_starts, starts, side='right') - 1
+
+    kept = np.arange(len(starts)) % skip == 0
+    starts = starts[kept]
+    stops = stops[kept]
+    dash_strokes = dash_strokes[kept]
+
+    # Gather the rows of every kept dash; neighbouring dashes share the cut
+    # point between them, so this is not a plain mask of merged
+    counts = stops - starts
+    dash_offsets = np.zeros(len(counts) + 1, dtype=np.int32)
+    np.cumsum(counts, out=dash_offsets[1:])
+    rows = np.arange(dash_offsets[-1]) + np.repeat(starts - dash_offsets[:-1], counts)
+
+    return StrokeSet(
+        merged[rows],
+        dash_offsets,
+        strokes.line_widths[dash_strokes],
+        strokes.material_indices[dash_strokes],
+    )
@@ -0,0 +1,192 @@
+import numpy as np
+from .emit_stroke import emit_stroke
+
+# The line width of strokes that are not given one, the same as the default
+# of scene.gw_thickness
+DEFAULT_LINE_WIDTH = 100
+
+
+class StrokeSet(object):
+    """
+    A sequence of strokes stored in a few flat arrays instead of nested
+    lists of vertices
+
+    Indexing with an int gives a view of the points of one stroke, and
+    iterating gives every stroke in turn, so a StrokeSet can be passed
+    wherever a list of strokes is expected. Slicing with a step of 1 gives a
+    StrokeSet that shares its points, like a numpy view.
+
+    Attributes
+    ----------
+    coords: numpy array of shape (n, 3)
+        The float32 points of every stroke, one stroke after another
+    offsets: numpy array of int
+        The int32 len(strokes) + 1 boundaries of the strokes in coords
+    line_widths: numpy array of int
+        The int32 line width of each stroke, DEFAULT_LINE_WIDTH unless given
+    material_indices: numpy array of int
+        The int32 material slot of each stroke
+    """
+
+    def __init__(self, coords=None, offsets=None, line_widths=None, material_indices=None):
+        if coords is None:
+            coords = np.zeros((0, 3), dtype=np.float32)
+        if offsets is None:
+            offsets = [0]
+
+        self.coords = np.asarray(coords, dtype=np.float32).reshape(-1, 3)
+        self.offsets = np.asarray(offsets, dtype=np.int32)
+        if self.offsets[0] != 0 or self.offsets[-1] != len(self.coords):
+            raise ValueError("Stroke offsets do not match the " + str(len(self.coords)) + " points")
+
+        stroke_count = len(self.offsets) - 1
+        self.line_widths = self.get_attribute(line_widths, stroke_count, DEFAULT_LINE_WIDTH)
+        self.material_indices = self.get_attribute(material_indices, stroke_count, 0)
+
+    @staticmethod
+    def get_attribute(values, stroke_count, default):
+        if values is None:
+            values = default
+        values = np.asarray(values, dtype=np.int32)
+        if values.ndim == 0:
+            return np.full(stroke_count, values, dtype=np.int32)
+        if len(values) != stroke_count:
+            raise ValueError("Expected a value for each of the " + str(stroke_count) + " strokes")
+        return values
+
+    @classmethod
+    def from_strokes(cls, strokes, line_widths=None, material_indices=None):
+        """
+        Pack a list of strokes, each a list of vertices or a numpy array of
+        shape (n, 3)
+        """
+        chunks = [np.asarray(stroke, dtype=np.float32).reshape(-1, 3) for stroke in strokes]
+        offsets = np.zeros(len(chunks) + 1, dtype=np.int32)
+        np.cumsum([len(chunk) for chunk in chunks], out=offsets[1:])
+        coords = np.concatenate(chunks) if chunks else None
+        return cls(coords, offsets, line_widths, material_indices)
+
+    @classmethod
+    def concatenate(cls, stroke_sets):
+        """
+        Join several StrokeSets into a new one, in order
+        """
+        stroke_sets = list(stroke_sets)
+        if len(stroke_sets) == 0:
+            return cls()
+
+        offsets = [np.zeros(1, dtype=np.int32)]
+        row = 0
+        for stroke_set in stroke_sets:
+            offsets.append(stroke_set.offsets[1:] + row)
+            row += len(stroke_set.coords)
+
+        return cls(
+            np.concatenate([stroke_set.coords for stroke_set in stroke_sets]),
+            np.concatenate(offsets),
+            np.concatenate([stroke_set.line_widths for stroke_set in stroke_sets]),
+            np.concatenate([stroke_set.material_indices for stroke_set in stroke_sets]),
+        )
+
+    @classmethod
+    def place(cls, templates, offsets, scales=None):
+        """
+        Join copies of several StrokeSets into a new one, each scaled about
+        the origin and then moved, with one vectorized pass over the points
+
+        The templates are left untouched, so they can be shared, like the
+        glyphs of load_glyph.
+
+        Parameters
+        ----------
+        templates: sequence of StrokeSet
+            The strokes to place, in order
+        offsets: sequence of sequences of 3 floats
+            Where to move each template
+        scales: sequence of floats or of sequences of 3 floats
+            How much to scale each template, if at all
+        """
+        templates = list(templates)
+        if len(templates) == 0:
+            return cls()
+
+        placed = cls.concatenate(templates)
+        counts = [len(template.coords) for template in templates]
+        if scales is not None:
+            scales = np.asarray(scales, dtype=np.float32).reshape(len(templates), -1)
+            placed.coords *= np.repeat(scales, counts, axis=0)
+        offsets = np.asarray(offsets, dtype=np.float32).reshape(len(templates), 3)
+        placed.coords += np.repeat(offsets, counts, axis=0)
+        return placed
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.coords[self.offsets[i]:self.offsets[i + 1]]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                indices = range(start, stop, step)
+                return StrokeSet.from_strokes(
+                    [self[i] for i in indices],
+                    self.line_widths[start:stop:step],
+                    self.material_indices[start:stop:step],
+                )
+            stop = max(start, stop)
+            return StrokeSet(
+                self.coords[self.offsets[start]:self.offsets[stop]],
+                self.offsets[start:stop + 1] - self.offsets[start],
+                self.line_widths[start:stop],
+                self.material_indices[start:stop],
+            )
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Stroke index out of range")
+        return self.coords[self.offsets[index]:self.offsets[index + 1]]
+
+    def get_point_counts(self):
+        """
+        Get the number of points of each stroke
+        """
+        return np.diff(self.offsets)
+
+    def copy(self):
+        return StrokeSet(
+            self.coords.copy(),
+            self.offsets.copy(),
+            self.line_widths.copy(),
+            self.material_indices.copy(),
+        )
+
+    def translate(self, offset):
+        """
+        Move every point by offset, a sequence of 3 floats, in place
+        """
+        self.coords += np.asarray(offset, dtype=np.float32)
+        return self
+
+    def scale(self, factor, origin=(0, 0, 0)):
+        """
+        Scale every point by factor, a float or a sequence of 3 floats,
+        about origin, in place
+        """
+        origin = np.asarray(origin, dtype=np.float32)
+        self.coords -= origin
+        self.coords *= np.asarray(factor, dtype=np.float32)
+        self.coords += origin
+        return self
+
+    def emit(self, frame, line_width=None):
+        """
+        Add every stroke to a grease pencil frame, with its material and its
+        line width, or line_width for every stroke if it is given
+        """
+        for i, stroke in enumerate(self):
+            width = self.line_widths[i] if line_width is None else line_width
+            emit_stroke(frame, stroke, width, material_index=self.material_indices[i])
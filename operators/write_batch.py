@@ -0,0 +1,154 @@
+import bpy
+import time
+from .utils import batch_frame_texts
+from .utils import unpack_framed_strokes
+from .utils import draw_framed_strokes
+from .utils import draw_live
+from .utils import draw_instanced
+from .utils import iter_line_glyphs
+from .utils import layout_text
+from .utils import read_manifest
+from .utils import get_material
+from .utils.layout import font_props
+from .write import get_simplify_tolerance
+
+
+def write_manifest(context, items, max_workers=1):
+    """
+    Write every text of a manifest as its own grease pencil object
+
+    The texts are laid out and resampled together, across a process pool
+    if max_workers asks for one, then emitted one after another. In the
+    Live and Instanced build modes nothing is resampled ahead of time, so
+    each text is laid out as it is written instead. Fields an item leaves
+    out fall back on the scene's Grease Writer settings, and items of the
+    same color share one material.
+
+    Parameters
+    ----------
+    context: bpy.types.Context
+    items: list of dict
+        As from read_manifest
+    max_workers: int or None
+        See batch_frame_texts
+
+    Returns
+    -------
+    report: list of dict
+        The "name" of each new object, its number of "strokes" and the
+        "seconds" it took to emit, after a first entry named "(layout)"
+        timing the layout and resampling of the whole batch
+    """
+    scene = context.scene
+
+    jobs = []
+    for item in items:
+        font = item.get("font", scene.gw_font)
+        if font not in font_props:
+            raise ValueError("Unknown font '" + font + "'")
+        jobs.append({
+            "text": item["text"].rstrip(),
+            "font": font,
+            "kerning": scene.gw_kerning,
+            "word_space": scene.gw_word_space,
+            "line_height": scene.gw_line_height,
+            "tolerance": get_simplify_tolerance(scene, item.get("scale", scene.gw_scale)),
+            "speed": item.get("speed", scene.gw_speed) / 10,
+        })
+
+    start = time.perf_counter()
+    if scene.gw_build_mode in ('INSTANCED', 'LIVE'):
+        # Instances only need the glyph positions and live drawings resample
+        # as the frame changes, so both are laid out as each text is written
+        packed_texts = [None for job in jobs]
+        stroke_count = 0
+    else:
+        packed_texts = batch_frame_texts(jobs, max_workers)
+        stroke_count = sum(len(p["gaps"]) for p in packed_texts)
+    report = [{"name": "(layout)", "strokes": stroke_count, "seconds": time.perf_counter() - start}]
+
+    frame_start = scene.frame_current
+    for item, job, packed in zip(items, jobs, packed_texts):
+        start = time.perf_counter()
+
+        gpencil = bpy.data.grease_pencils.new('greasewriter')
+        obj = bpy.data.objects.new(item.get("name", 'greasewritten'), gpencil)
+        obj.data.materials.append(get_material('writings', item.get("color", scene.gw_color)))
+        scene.collection.objects.link(obj)
+
+        scene.frame_current = item.get("start_frame", frame_start)
+        if scene.gw_build_mode == 'INSTANCED':
+            line_glyphs = list(iter_line_glyphs(
+                job["text"].split('\n'),
+                job["font"],
+                kerning=job["kerning"],
+                word_space=job["word_space"],
+                line_height=job["line_height"],
+                tolerance=job["tolerance"]
+            ))
+            draw_instanced(obj, line_glyphs, job["font"], tolerance=job["tolerance"])
+            stroke_count = sum(glyphs[-1]["strokes"][1] for glyphs in line_glyphs if glyphs)
+        elif scene.gw_build_mode == 'LIVE':
+            glyph_strokes, glyphs = layout_text(
+                job["text"],
+                job["font"],
+                kerning=job["kerning"],
+                word_space=job["word_space"],
+                line_height=job["line_height"],
+                tolerance=job["tolerance"]
+            )
+            draw_live(obj, glyph_strokes, speed=item.get("speed", scene.gw_speed))
+            stroke_count = len(glyph_strokes)
+        else:
+            draw_framed_strokes(obj, unpack_framed_strokes(packed))
+            stroke_count = len(packed["gaps"])
+
+        scale = item.get("scale", scene.gw_scale)
+        obj.scale[0] = scale
+        obj.scale[1] = scale
+        obj.scale[2] = scale
+        obj.location = item.get("position", (0, 0, 0))
+        obj.empty_display_size = 0.5
+
+        report.append({"name": obj.name, "strokes": stroke_count,
+                       "seconds": time.perf_counter() - start})
+
+    scene.frame_current = frame_start
+    return report
+
+
+def format_report(report):
+    """
+    Get the lines printed for a write_manifest report
+    """
+    return ["{0:<24} {1:>7} strokes {2:>9.3f} s".format(entry["name"], entry["strokes"], entry["seconds"])
+            for entry in report]
+
+
+class GREASEPENCIL_OT_write_batch(bpy.types.Operator):
+    bl_label = "Write Manifest"
+    bl_idname = "grease_writer.write_batch"
+    bl_description = "Create drawn-animated text objects for every text listed in a CSV or JSON manifest"
+    bl_options = {"REGISTER", "UNDO"}
+
+    filepath: bpy.props.StringProperty(subtype="FILE_PATH")
+    filter_glob: bpy.props.StringProperty(default="*.csv;*.json", options={"HIDDEN"})
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {"RUNNING_MODAL"}
+
+    def execute(self, context):
+        try:
+            items = read_manifest(bpy.path.abspath(self.filepath))
+            report = write_manifest(context, items)
+        except (OSError, ValueError) as error:
+            self.report({"ERROR"}, str(error))
+            return {"CANCELLED"}
+
+        for line in format_report(report):
+            print(line)
+
+        seconds = sum(entry["seconds"] for entry in report)
+        self.report({"INFO"}, "Wrote " + str(len(items)) + " texts in " + str(round(seconds, 2)) + " s")
+        return {"FINISHED"}